@@ -0,0 +1,171 @@
+"""
+Performance test script executed inside the Dagger test container.
+
+Parameters are read from the environment so the script file itself never
+changes between runs:
+    DURATION_SECONDS: Test duration in seconds (default: 60)
+    CONCURRENT_CONNECTIONS: Number of concurrent connections (default: 10)
+
+Progress is logged to stderr; the final result is printed to stdout as a
+single JSON document for the pipeline to parse.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+import statistics
+from mcp_client_cli.config import AppConfig, LLMConfig, ServerConfig
+from mcp_client_cli.testing import MCPServerTester
+
+DURATION_SECONDS = int(os.environ.get("DURATION_SECONDS", "60"))
+CONCURRENT_CONNECTIONS = int(os.environ.get("CONCURRENT_CONNECTIONS", "10"))
+
+
+def log(*args):
+    """Print progress output to stderr, keeping stdout for the JSON result."""
+    print(*args, file=sys.stderr)
+
+
+async def performance_test_single_server(
+    server_name: str,
+    config: AppConfig,
+    iterations: int = 10,
+    max_in_flight: int = CONCURRENT_CONNECTIONS
+):
+    """Run performance test for a single server."""
+    tester = MCPServerTester(config)
+    server_config = config.mcp_servers[server_name]
+    semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def _one_iteration():
+        """Time a single request on the shared session, bounded by the semaphore."""
+        async with semaphore:
+            start_time = time.time()
+            result = await tester.test_server_ping(server_config, server_name)
+            return time.time() - start_time, result.status.value == "passed"
+
+    try:
+        # Spawn the server and complete the MCP handshake once; every
+        # iteration then only pays for a request on the open session
+        await tester.connect(server_config, server_name)
+
+        # Iterations are independent, so run them concurrently instead of
+        # one after another with a fixed delay in between
+        outcomes = await asyncio.gather(
+            *[asyncio.create_task(_one_iteration()) for _ in range(iterations)]
+        )
+        times = [execution_time for execution_time, _ in outcomes]
+        success_count = sum(1 for _, passed in outcomes if passed)
+
+        # Calculate metrics
+        avg_time = statistics.mean(times)
+        min_time = min(times)
+        max_time = max(times)
+        success_rate = success_count / iterations
+
+        return {
+            "server": server_name,
+            "iterations": iterations,
+            "success_rate": success_rate,
+            "avg_time": avg_time,
+            "min_time": min_time,
+            "max_time": max_time,
+            "times": times
+        }
+
+    except Exception as e:
+        return {
+            "server": server_name,
+            "error": str(e),
+            "success_rate": 0.0
+        }
+
+    finally:
+        await tester.cleanup()
+
+async def run_performance_tests():
+    """Run comprehensive performance tests."""
+    log("⚡ Starting Performance Tests via Dagger Pipeline")
+    log("=" * 60)
+
+    # Test configuration
+    config = AppConfig(
+        llm=LLMConfig(
+            model="gpt-4o-mini",
+            provider="openai",
+            temperature=0.0
+        ),
+        system_prompt="Performance testing via Dagger pipeline",
+        mcp_servers={
+            "python-perf": ServerConfig(
+                command="python",
+                args=["examples/generic_mcp_server.py"],
+                env={},
+                enabled=True,
+                exclude_tools=[],
+                requires_confirmation=[]
+            )
+        },
+        tools_requires_confirmation=[]
+    )
+
+    log(f"🔧 Duration: {DURATION_SECONDS}s | Concurrent Connections: {CONCURRENT_CONNECTIONS}")
+
+    # Run performance tests
+    start_time = time.time()
+
+    # Create tasks for concurrent testing
+    tasks = []
+    for i in range(CONCURRENT_CONNECTIONS):
+        task = performance_test_single_server("python-perf", config, 10)
+        tasks.append(task)
+
+    # Run concurrent tests
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    total_time = time.time() - start_time
+
+    # Analyze results
+    successful_results = [r for r in results if isinstance(r, dict) and "error" not in r]
+    failed_results = [r for r in results if isinstance(r, dict) and "error" in r]
+
+    if successful_results:
+        all_times = []
+        total_success_rate = 0.0
+
+        for result in successful_results:
+            all_times.extend(result["times"])
+            total_success_rate += result["success_rate"]
+
+        avg_success_rate = total_success_rate / len(successful_results)
+        overall_avg_time = statistics.mean(all_times)
+        overall_min_time = min(all_times)
+        overall_max_time = max(all_times)
+
+        # Performance thresholds
+        passed = avg_success_rate >= 0.95 and overall_avg_time <= 2.0
+        return {
+            "status": "PASSED" if passed else "MARGINAL",
+            "duration_seconds": DURATION_SECONDS,
+            "concurrent_connections": CONCURRENT_CONNECTIONS,
+            "successful_connections": len(successful_results),
+            "average_success_rate": avg_success_rate,
+            "avg_response_time": overall_avg_time,
+            "min_response_time": overall_min_time,
+            "max_response_time": overall_max_time,
+            "total_time": total_time
+        }
+    else:
+        return {
+            "status": "FAILED",
+            "duration_seconds": DURATION_SECONDS,
+            "concurrent_connections": CONCURRENT_CONNECTIONS,
+            "failures": len(failed_results),
+            "total_time": total_time
+        }
+
+if __name__ == "__main__":
+    result = asyncio.run(run_performance_tests())
+    print(json.dumps(result))
@@ -7,14 +7,30 @@ pragmatism principles with confidence scoring and systematic verification.
 """
 
 import json
-import statistics
+import re
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 
 from .test_matrix import TestMatrixConfig, TestResult, TestType, TestEnvironment
 
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speed-up for JSON reports; fall back to stdlib json
+    orjson = None
+
+# Error categories in priority order, one capture group per category in
+# ERROR_CATEGORY_PATTERN so a match's group index maps straight to a name
+ERROR_CATEGORIES = ("timeout", "connection", "dependency", "permission", "memory", "syntax")
+ERROR_CATEGORY_PATTERN = re.compile(
+    r"(timeout)|(connect)|(import|module)|(permission|access)|(memory|oom)|(syntax|parse)",
+    re.IGNORECASE
+)
+
 
 class PipelineStatus(Enum):
     """Overall pipeline execution status."""
@@ -24,7 +40,7 @@ class PipelineStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineMetrics:
     """
     Comprehensive metrics for pipeline execution.
@@ -53,84 +69,124 @@ class PipelineMetrics:
     test_type_breakdown: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     
     def calculate_derived_metrics(self, results: List[TestResult]):
-        """Calculate derived metrics from test results."""
+        """Calculate derived metrics from test results in a single pass."""
         if not results:
             return
         
-        # Basic counts
-        self.total_tests = len(results)
-        self.passed_tests = sum(1 for r in results if r.success)
-        self.failed_tests = sum(1 for r in results if not r.success and r.error_message is None)
-        self.error_tests = sum(1 for r in results if r.error_message is not None)
-        
-        # Execution time metrics
-        execution_times = [r.execution_time for r in results]
-        self.total_execution_time = sum(execution_times)
-        self.average_execution_time = statistics.mean(execution_times)
-        self.min_execution_time = min(execution_times)
-        self.max_execution_time = max(execution_times)
-        
-        # Confidence metrics
-        confidence_scores = [r.confidence_score for r in results if r.confidence_score > 0]
-        if confidence_scores:
-            self.overall_confidence = statistics.mean(confidence_scores)
+        passed = failed = errors = 0
+        total_time = mean_time = 0.0
+        min_time = max_time = results[0].execution_time
+        confidence_mean = 0.0
+        confidence_count = high_confidence = medium_confidence = low_confidence = 0
+        
+        # Per-group running sums, so breakdowns never re-scan their results:
+        # environments hold [total, passed, time_sum, confidence_sum, confidence_count],
+        # test types (which report no confidence) hold [total, passed, time_sum]
+        env_stats: Dict[str, List[Any]] = {}
+        type_stats: Dict[str, List[Any]] = {}
+        
+        # Bind loop-invariant lookups to locals once rather than per result
+        env_bucket = env_stats.setdefault
+        type_bucket = type_stats.setdefault
+        
+        for count, result in enumerate(results, 1):
+            config = result.config
+            execution_time = result.execution_time
+            confidence = result.confidence_score
+            success = result.success
+            
+            # Basic counts
+            if success:
+                passed += 1
+            if result.error_message is not None:
+                errors += 1
+            elif not success:
+                failed += 1
+            
+            # Execution time metrics (running mean avoids a second pass)
+            total_time += execution_time
+            mean_time += (execution_time - mean_time) / count
+            if execution_time < min_time:
+                min_time = execution_time
+            elif execution_time > max_time:
+                max_time = execution_time
+            
+            # Confidence metrics
+            if confidence > 0:
+                confidence_count += 1
+                confidence_mean += (confidence - confidence_mean) / confidence_count
+                if confidence > 0.9:
+                    high_confidence += 1
+                elif confidence >= 0.7:
+                    medium_confidence += 1
+                else:
+                    low_confidence += 1
+            
+            # Environment breakdown
+            stats = env_bucket(config.environment.value, [0, 0, 0.0, 0.0, 0])
+            stats[0] += 1
+            stats[1] += success
+            stats[2] += execution_time
+            if confidence > 0:
+                stats[3] += confidence
+                stats[4] += 1
+            
+            # Test type breakdown
+            for test_type in config.test_types:
+                stats = type_bucket(test_type.value, [0, 0, 0.0])
+                stats[0] += 1
+                stats[1] += success
+                stats[2] += execution_time
+        
+        total = len(results)
+        self.total_tests = total
+        self.passed_tests = passed
+        self.failed_tests = failed
+        self.error_tests = errors
+        
+        self.total_execution_time = total_time
+        self.average_execution_time = mean_time
+        self.min_execution_time = min_time
+        self.max_execution_time = max_time
+        
+        if confidence_count:
+            self.overall_confidence = confidence_mean
             
             # Confidence distribution
             self.confidence_distribution = {
-                "high (>0.9)": sum(1 for c in confidence_scores if c > 0.9),
-                "medium (0.7-0.9)": sum(1 for c in confidence_scores if 0.7 <= c <= 0.9),
-                "low (<0.7)": sum(1 for c in confidence_scores if c < 0.7)
+                "high (>0.9)": high_confidence,
+                "medium (0.7-0.9)": medium_confidence,
+                "low (<0.7)": low_confidence
             }
         
-        # Success and error rates
-        self.success_rate = self.passed_tests / self.total_tests if self.total_tests > 0 else 0.0
-        self.error_rate = self.error_tests / self.total_tests if self.total_tests > 0 else 0.0
-        
-        # Environment breakdown
-        env_groups = {}
-        for result in results:
-            env_name = result.config.environment.value
-            if env_name not in env_groups:
-                env_groups[env_name] = []
-            env_groups[env_name].append(result)
-        
-        for env_name, env_results in env_groups.items():
-            env_passed = sum(1 for r in env_results if r.success)
-            env_total = len(env_results)
-            env_avg_time = statistics.mean([r.execution_time for r in env_results])
-            env_confidence = statistics.mean([r.confidence_score for r in env_results if r.confidence_score > 0])
-            
-            self.environment_breakdown[env_name] = {
+        # Success and error rates (results is non-empty here)
+        self.success_rate = passed / total
+        self.error_rate = errors / total
+        
+        # Breakdowns are divided out of the per-group sums in one sweep each
+        self.environment_breakdown = {
+            env_name: {
                 "total": env_total,
                 "passed": env_passed,
-                "success_rate": env_passed / env_total if env_total > 0 else 0.0,
-                "avg_execution_time": env_avg_time,
-                "avg_confidence": env_confidence if env_confidence else 0.0
+                "success_rate": env_passed / env_total,
+                "avg_execution_time": env_time / env_total,
+                "avg_confidence": env_conf / env_conf_n if env_conf_n else 0.0
             }
+            for env_name, (env_total, env_passed, env_time, env_conf, env_conf_n) in env_stats.items()
+        }
         
-        # Test type breakdown
-        type_groups = {}
-        for result in results:
-            for test_type in result.config.test_types:
-                type_name = test_type.value
-                if type_name not in type_groups:
-                    type_groups[type_name] = []
-                type_groups[type_name].append(result)
-        
-        for type_name, type_results in type_groups.items():
-            type_passed = sum(1 for r in type_results if r.success)
-            type_total = len(type_results)
-            type_avg_time = statistics.mean([r.execution_time for r in type_results])
-            
-            self.test_type_breakdown[type_name] = {
+        self.test_type_breakdown = {
+            type_name: {
                 "total": type_total,
                 "passed": type_passed,
-                "success_rate": type_passed / type_total if type_total > 0 else 0.0,
-                "avg_execution_time": type_avg_time
+                "success_rate": type_passed / type_total,
+                "avg_execution_time": type_time / type_total
             }
+            for type_name, (type_total, type_passed, type_time) in type_stats.items()
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineReport:
     """
     Comprehensive pipeline execution report.
@@ -162,10 +218,21 @@ class PipelineReport:
     
     def generate_analysis(self):
         """Generate comprehensive analysis and recommendations."""
+        # Sweep the environment breakdown once for both slow and failing
+        # environments instead of once per analysis step
+        slow_threshold = self.metrics.average_execution_time * 1.5
+        slow_envs = []
+        failing_envs = []
+        for env_name, env_data in self.metrics.environment_breakdown.items():
+            if env_data["avg_execution_time"] > slow_threshold:
+                slow_envs.append(f"{env_name} ({env_data['avg_execution_time']:.1f}s)")
+            if env_data["success_rate"] < 0.8:
+                failing_envs.append((env_name, env_data["success_rate"]))
+        
         self._analyze_confidence()
-        self._analyze_performance()
+        self._analyze_performance(slow_envs)
         self._analyze_failures()
-        self._generate_recommendations()
+        self._generate_recommendations(failing_envs)
     
     def _analyze_confidence(self):
         """Analyze confidence scores and provide assessment."""
@@ -190,7 +257,7 @@ class PipelineReport:
                 "Results require significant review and re-testing."
             )
     
-    def _analyze_performance(self):
+    def _analyze_performance(self, slow_envs: List[str]):
         """Analyze performance metrics and identify bottlenecks."""
         avg_time = self.metrics.average_execution_time
         max_time = self.metrics.max_execution_time
@@ -209,12 +276,6 @@ class PipelineReport:
             f"(Avg: {avg_time:.1f}s, Max: {max_time:.1f}s, Total: {self.metrics.total_execution_time:.1f}s)"
         )
         
-        # Identify slow environments
-        slow_envs = []
-        for env_name, env_data in self.metrics.environment_breakdown.items():
-            if env_data["avg_execution_time"] > avg_time * 1.5:
-                slow_envs.append(f"{env_name} ({env_data['avg_execution_time']:.1f}s)")
-        
         if slow_envs:
             self.performance_analysis += f" | Slow environments: {', '.join(slow_envs)}"
     
@@ -224,59 +285,60 @@ class PipelineReport:
             self.failure_analysis = "No failures detected - all tests passed successfully."
             return
         
-        # Categorize failures
-        failure_patterns = {}
-        error_patterns = {}
+        # Count failures per pattern; only the counts are reported, so the
+        # failing results themselves are not collected
+        failure_patterns: Counter = Counter()
+        error_patterns: Counter = Counter()
+        
+        categorize_error = self._categorize_error
         
         for result in self.results:
-            if not result.success:
-                if result.error_message:
-                    # Categorize errors by type
-                    error_type = self._categorize_error(result.error_message)
-                    if error_type not in error_patterns:
-                        error_patterns[error_type] = []
-                    error_patterns[error_type].append(result)
-                else:
-                    # Categorize failures by environment/test type
-                    failure_key = f"{result.config.environment.value}_{result.config.test_types[0].value if result.config.test_types else 'unknown'}"
-                    if failure_key not in failure_patterns:
-                        failure_patterns[failure_key] = []
-                    failure_patterns[failure_key].append(result)
+            if result.success:
+                continue
+            
+            error_message = result.error_message
+            if error_message:
+                # Categorize errors by type
+                error_patterns[categorize_error(error_message)] += 1
+            else:
+                # Categorize failures by environment/test type
+                config = result.config
+                test_types = config.test_types
+                failure_patterns[(
+                    config.environment.value,
+                    test_types[0].value if test_types else "unknown"
+                )] += 1
         
         analysis_parts = []
         
         if failure_patterns:
             analysis_parts.append(f"Test failures: {len(failure_patterns)} patterns identified")
-            for pattern, failures in failure_patterns.items():
-                analysis_parts.append(f"  - {pattern}: {len(failures)} failures")
+            for (env_name, type_name), failures in failure_patterns.items():
+                analysis_parts.append(f"  - {env_name}_{type_name}: {failures} failures")
         
         if error_patterns:
             analysis_parts.append(f"Execution errors: {len(error_patterns)} error types")
             for error_type, errors in error_patterns.items():
-                analysis_parts.append(f"  - {error_type}: {len(errors)} occurrences")
+                analysis_parts.append(f"  - {error_type}: {errors} occurrences")
         
         self.failure_analysis = " | ".join(analysis_parts) if analysis_parts else "No specific failure patterns identified."
     
-    def _categorize_error(self, error_message: str) -> str:
-        """Categorize error message into common error types."""
-        error_lower = error_message.lower()
-        
-        if "timeout" in error_lower:
-            return "timeout"
-        elif "connection" in error_lower or "connect" in error_lower:
-            return "connection"
-        elif "import" in error_lower or "module" in error_lower:
-            return "dependency"
-        elif "permission" in error_lower or "access" in error_lower:
-            return "permission"
-        elif "memory" in error_lower or "oom" in error_lower:
-            return "memory"
-        elif "syntax" in error_lower or "parse" in error_lower:
-            return "syntax"
-        else:
-            return "other"
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _categorize_error(error_message: str) -> str:
+        """Categorize error message into common error types (cached per message)."""
+        # One scan over the message; when several categories match, the
+        # highest-priority one (lowest group index) wins
+        best = None
+        for match in ERROR_CATEGORY_PATTERN.finditer(error_message):
+            if best is None or match.lastindex < best:
+                best = match.lastindex
+                if best == 1:
+                    break
+        
+        return ERROR_CATEGORIES[best - 1] if best is not None else "other"
     
-    def _generate_recommendations(self):
+    def _generate_recommendations(self, failing_envs: List[Tuple[str, float]]):
         """Generate actionable recommendations based on analysis."""
         recommendations = []
         
@@ -299,11 +361,10 @@ class PipelineReport:
             )
         
         # Environment-specific recommendations
-        for env_name, env_data in self.metrics.environment_breakdown.items():
-            if env_data["success_rate"] < 0.8:
-                recommendations.append(
-                    f"Fix {env_name} environment issues: Success rate is {env_data['success_rate']:.1%}"
-                )
+        for env_name, success_rate in failing_envs:
+            recommendations.append(
+                f"Fix {env_name} environment issues: Success rate is {success_rate:.1%}"
+            )
         
         # Error-specific recommendations
         if self.metrics.error_rate > 0.1:
@@ -334,7 +395,8 @@ class PipelineReportGenerator:
         results: List[TestResult],
         execution_start: datetime,
         execution_end: datetime,
-        environment_info: Optional[Dict[str, str]] = None
+        environment_info: Optional[Dict[str, str]] = None,
+        keep_results: bool = True
     ) -> PipelineReport:
         """
         Create a comprehensive pipeline report.
@@ -345,6 +407,7 @@ class PipelineReportGenerator:
             execution_start: Pipeline start time
             execution_end: Pipeline end time
             environment_info: Optional environment information
+            keep_results: Whether to keep raw results on the report after analysis
             
         Returns:
             PipelineReport: Comprehensive pipeline report
@@ -377,6 +440,10 @@ class PipelineReportGenerator:
         # Generate analysis
         report.generate_analysis()
         
+        # The raw results are only read by the analysis above
+        if not keep_results:
+            report.results = []
+        
         return report
     
     @staticmethod
@@ -402,8 +469,10 @@ class PipelineReportGenerator:
     def _format_detailed(report: PipelineReport) -> str:
         """Format detailed report."""
         duration = report.execution_duration
+        metrics = report.metrics
         
-        output = f"""
+        parts: List[str] = []
+        parts.append(f"""
 🚀 MCP TESTING PIPELINE REPORT
 {'=' * 70}
 
@@ -416,55 +485,61 @@ End Time: {report.execution_end.strftime('%Y-%m-%d %H:%M:%S')}
 
 📊 TEST METRICS
 {'=' * 30}
-Total Tests: {report.metrics.total_tests}
-✅ Passed: {report.metrics.passed_tests} ({report.metrics.success_rate:.1%})
-❌ Failed: {report.metrics.failed_tests}
-💥 Errors: {report.metrics.error_tests}
-⏭️  Skipped: {report.metrics.skipped_tests}
+Total Tests: {metrics.total_tests}
+✅ Passed: {metrics.passed_tests} ({metrics.success_rate:.1%})
+❌ Failed: {metrics.failed_tests}
+💥 Errors: {metrics.error_tests}
+⏭️  Skipped: {metrics.skipped_tests}
 
 ⏱️  PERFORMANCE METRICS
 {'=' * 30}
-Total Execution Time: {report.metrics.total_execution_time:.1f}s
-Average Test Time: {report.metrics.average_execution_time:.1f}s
-Fastest Test: {report.metrics.min_execution_time:.1f}s
-Slowest Test: {report.metrics.max_execution_time:.1f}s
+Total Execution Time: {metrics.total_execution_time:.1f}s
+Average Test Time: {metrics.average_execution_time:.1f}s
+Fastest Test: {metrics.min_execution_time:.1f}s
+Slowest Test: {metrics.max_execution_time:.1f}s
 
 🎯 CONFIDENCE ANALYSIS
 {'=' * 30}
-Overall Confidence: {report.metrics.overall_confidence:.2%}
+Overall Confidence: {metrics.overall_confidence:.2%}
 {report.confidence_assessment}
 
 Confidence Distribution:
-"""
+""")
         
-        for level, count in report.metrics.confidence_distribution.items():
-            output += f"  {level}: {count} tests\n"
+        parts.extend(
+            f"  {level}: {count} tests\n"
+            for level, count in metrics.confidence_distribution.items()
+        )
         
-        output += f"""
+        parts.append(f"""
 🔧 ENVIRONMENT BREAKDOWN
 {'=' * 30}
-"""
+""")
         
-        for env_name, env_data in report.metrics.environment_breakdown.items():
-            output += f"""
+        parts.extend(
+            f"""
 {env_name.upper()}:
   Tests: {env_data['total']} | Passed: {env_data['passed']} ({env_data['success_rate']:.1%})
   Avg Time: {env_data['avg_execution_time']:.1f}s | Confidence: {env_data['avg_confidence']:.2%}
 """
+            for env_name, env_data in metrics.environment_breakdown.items()
+        )
         
-        output += f"""
+        parts.append(f"""
 🧪 TEST TYPE BREAKDOWN
 {'=' * 30}
-"""
+""")
         
-        for type_name, type_data in report.metrics.test_type_breakdown.items():
-            output += f"""
+        parts.extend(
+            f"""
 {type_name.upper()}:
   Tests: {type_data['total']} | Passed: {type_data['passed']} ({type_data['success_rate']:.1%})
   Avg Time: {type_data['avg_execution_time']:.1f}s
 """
+            for type_name, type_data in metrics.test_type_breakdown.items()
+        )
         
-        output += f"""
+        parts.append(f"""
 📈 PERFORMANCE ANALYSIS
 {'=' * 30}
 {report.performance_analysis}
@@ -475,31 +550,32 @@ Confidence Distribution:
 
 💡 RECOMMENDATIONS
 {'=' * 30}
-"""
+""")
         
         if report.recommendations:
-            for i, rec in enumerate(report.recommendations, 1):
-                output += f"{i}. {rec}\n"
+            parts.extend(f"{i}. {rec}\n" for i, rec in enumerate(report.recommendations, 1))
         else:
-            output += "No specific recommendations - pipeline executed successfully.\n"
+            parts.append("No specific recommendations - pipeline executed successfully.\n")
         
-        return output
+        return "".join(parts)
     
     @staticmethod
     def _format_summary(report: PipelineReport) -> str:
         """Format summary report."""
         duration = report.execution_duration
+        metrics = report.metrics
         
         return f"""
 🚀 Pipeline {report.pipeline_id} - {report.status.value.upper()}
-⏱️  Duration: {duration.total_seconds():.1f}s | Tests: {report.metrics.total_tests}
-✅ Success: {report.metrics.success_rate:.1%} | 🎯 Confidence: {report.metrics.overall_confidence:.2%}
-📊 Passed: {report.metrics.passed_tests} | Failed: {report.metrics.failed_tests} | Errors: {report.metrics.error_tests}
+⏱️  Duration: {duration.total_seconds():.1f}s | Tests: {metrics.total_tests}
+✅ Success: {metrics.success_rate:.1%} | 🎯 Confidence: {metrics.overall_confidence:.2%}
+📊 Passed: {metrics.passed_tests} | Failed: {metrics.failed_tests} | Errors: {metrics.error_tests}
 """
     
     @staticmethod
     def _format_json(report: PipelineReport) -> str:
         """Format JSON report."""
+        metrics = report.metrics
         data = {
             "pipeline_id": report.pipeline_id,
             "status": report.status.value,
@@ -507,16 +583,16 @@ Confidence Distribution:
             "execution_end": report.execution_end.isoformat(),
             "duration_seconds": report.execution_duration.total_seconds(),
             "metrics": {
-                "total_tests": report.metrics.total_tests,
-                "passed_tests": report.metrics.passed_tests,
-                "failed_tests": report.metrics.failed_tests,
-                "error_tests": report.metrics.error_tests,
-                "success_rate": report.metrics.success_rate,
-                "overall_confidence": report.metrics.overall_confidence,
-                "total_execution_time": report.metrics.total_execution_time,
-                "average_execution_time": report.metrics.average_execution_time,
-                "environment_breakdown": report.metrics.environment_breakdown,
-                "test_type_breakdown": report.metrics.test_type_breakdown
+                "total_tests": metrics.total_tests,
+                "passed_tests": metrics.passed_tests,
+                "failed_tests": metrics.failed_tests,
+                "error_tests": metrics.error_tests,
+                "success_rate": metrics.success_rate,
+                "overall_confidence": metrics.overall_confidence,
+                "total_execution_time": metrics.total_execution_time,
+                "average_execution_time": metrics.average_execution_time,
+                "environment_breakdown": metrics.environment_breakdown,
+                "test_type_breakdown": metrics.test_type_breakdown
             },
             "analysis": {
                 "confidence_assessment": report.confidence_assessment,
@@ -526,4 +602,6 @@ Confidence Distribution:
             "recommendations": report.recommendations
         }
         
-        return json.dumps(data, indent=2) 
\ No newline at end of file
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(data, indent=2)
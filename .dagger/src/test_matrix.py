@@ -6,19 +6,28 @@ for comprehensive MCP testing scenarios across different environments,
 Python versions, and server configurations.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
-from enum import Enum
+import hashlib
+import json
+import os
+import pickle
+import random
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
+from functools import lru_cache, wraps
+from itertools import groupby, product
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional, Any, Tuple
+from enum import StrEnum
 
 
-class TestEnvironment(Enum):
+class TestEnvironment(StrEnum):
     """Test environment types."""
     PYTHON_ONLY = "python"
     NODEJS_ONLY = "nodejs"
     MULTI_LANGUAGE = "multi"
 
 
-class TestType(Enum):
+class TestType(StrEnum):
     """Test types for matrix execution."""
     FUNCTIONAL = "functional"
     PERFORMANCE = "performance"
@@ -27,7 +36,37 @@ class TestType(Enum):
     COMPATIBILITY = "compatibility"
 
 
-@dataclass
+# Summary sections are listed in environment declaration order
+ENVIRONMENT_ORDER = {env: index for index, env in enumerate(TestEnvironment)}
+
+# Per-environment settings for performance configs; performance runs get a
+# longer timeout than the default
+PERFORMANCE_DEFAULTS: Dict[TestEnvironment, Dict[str, Any]] = {
+    TestEnvironment.PYTHON_ONLY: {"python_version": "3.12"},
+    TestEnvironment.NODEJS_ONLY: {"node_version": "20"},
+    TestEnvironment.MULTI_LANGUAGE: {"python_version": "3.12", "node_version": "20"},
+}
+
+# Container image a config runs in: (environment, python_version, node_version)
+ImageKey = Tuple[TestEnvironment, Optional[str], Optional[str]]
+
+# Section markers for the matrix summary, with ASCII fallbacks for CI log
+# consumers that are not UTF-8 safe
+SUMMARY_ICONS = {"environment": "🔧", "statistics": "📊"}
+SUMMARY_ASCII_ICONS = {"environment": "[ENV]", "statistics": "[STATS]"}
+
+# Picks which versions of a matrix axis to test, e.g. all of them or one
+VersionSampler = Callable[[List[str]], List[str]]
+
+# Where results of unchanged configs are cached between pipeline runs;
+# anchored to the Dagger module so it does not depend on the working directory
+RESULT_CACHE_DIR = Path(__file__).resolve().parents[1] / ".cache"
+
+# Weight of the newest run in the exponentially weighted duration history
+DURATION_HISTORY_ALPHA = 0.3
+
+
+@dataclass(frozen=True, slots=True)
 class TestMatrixConfig:
     """
     Configuration for a single test matrix entry.
@@ -38,7 +77,7 @@ class TestMatrixConfig:
     environment: TestEnvironment
     python_version: Optional[str] = None
     node_version: Optional[str] = None
-    test_types: List[TestType] = field(default_factory=lambda: [TestType.FUNCTIONAL])
+    test_types: Tuple[TestType, ...] = (TestType.FUNCTIONAL,)
     server_configs: List[str] = field(default_factory=list)
     environment_variables: Dict[str, str] = field(default_factory=dict)
     timeout_seconds: int = 300
@@ -47,18 +86,50 @@ class TestMatrixConfig:
     
     def __post_init__(self):
         """Validate configuration after initialization."""
-        if self.environment == TestEnvironment.PYTHON_ONLY and not self.python_version:
-            self.python_version = "3.12"
-        elif self.environment == TestEnvironment.NODEJS_ONLY and not self.node_version:
-            self.node_version = "20"
-        elif self.environment == TestEnvironment.MULTI_LANGUAGE:
+        # Dispatch on the environment once; builder configs already carry their
+        # versions. Frozen dataclass, so defaults go through object.__setattr__
+        environment = self.environment
+        if environment == TestEnvironment.PYTHON_ONLY:
+            if not self.python_version:
+                object.__setattr__(self, "python_version", "3.12")
+        elif environment == TestEnvironment.NODEJS_ONLY:
+            if not self.node_version:
+                object.__setattr__(self, "node_version", "20")
+        elif environment == TestEnvironment.MULTI_LANGUAGE:
             if not self.python_version:
-                self.python_version = "3.12"
+                object.__setattr__(self, "python_version", "3.12")
             if not self.node_version:
-                self.node_version = "20"
+                object.__setattr__(self, "node_version", "20")
+    
+    @property
+    def _key(self) -> Tuple[Any, ...]:
+        """Identity of the environment this config runs in, excluding its test types."""
+        return (
+            self.environment.value,
+            self.python_version,
+            self.node_version,
+            tuple(sorted(self.server_configs)),
+            tuple(sorted(self.environment_variables.items())),
+            self.timeout_seconds,
+            self.retry_count,
+            self.parallel_execution
+        )
+    
+    def cache_key(self, code_sha: str) -> str:
+        """
+        Stable identity of this config's run against a given code revision.
+        
+        Args:
+            code_sha: Revision (e.g. git commit SHA) of the code under test
+            
+        Returns:
+            str: Hex digest identifying the config, its test types and the revision
+        """
+        identity = (self._key, tuple(t.value for t in self.test_types), code_sha)
+        return hashlib.blake2b(repr(identity).encode(), digest_size=16).hexdigest()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TestResult:
     """Result of a single test matrix execution."""
     config: TestMatrixConfig
@@ -70,6 +141,148 @@ class TestResult:
     metrics: Dict[str, Any] = field(default_factory=dict)
 
 
+def _duration_keys(config: TestMatrixConfig) -> List[str]:
+    """Duration history keys for a config, one per test type run in its image."""
+    image = f"{config.environment.value}:{config.python_version or '-'}:{config.node_version or '-'}"
+    return [f"{image}:{test_type.value}" for test_type in config.test_types]
+
+
+def _estimated_duration(config: TestMatrixConfig, history: Dict[str, float]) -> float:
+    """Estimate a config's runtime from history, falling back to its timeout."""
+    keys = _duration_keys(config)
+    if not keys:
+        return float(config.timeout_seconds)
+    fallback = config.timeout_seconds / len(keys)
+    return sum(history.get(key, fallback) for key in keys)
+
+
+def load_duration_history(history_path: Path) -> Dict[str, float]:
+    """
+    Load recorded test durations.
+    
+    Args:
+        history_path: JSON file mapping duration history keys to seconds
+        
+    Returns:
+        Dict[str, float]: Recorded durations (empty if no history exists yet)
+    """
+    try:
+        return json.loads(Path(history_path).read_text())
+    except FileNotFoundError:
+        return {}
+
+
+def record_execution_times(
+    results: List[TestResult],
+    history_path: Path,
+    alpha: float = DURATION_HISTORY_ALPHA
+) -> Dict[str, float]:
+    """
+    Fold execution times into the duration history used for timed batching.
+    
+    A batched result's time is split evenly across its test types, so
+    history stays comparable whether configs ran alone or batched.
+    
+    Args:
+        results: Test results to record
+        history_path: JSON file holding the duration history
+        alpha: Weight of the new measurement in the moving average
+        
+    Returns:
+        Dict[str, float]: Updated duration history
+    """
+    history = load_duration_history(history_path)
+    
+    for result in results:
+        keys = _duration_keys(result.config)
+        if not keys:
+            continue
+        share = result.execution_time / len(keys)
+        for key in keys:
+            previous = history.get(key)
+            history[key] = share if previous is None else alpha * share + (1 - alpha) * previous
+    
+    Path(history_path).write_text(json.dumps(history, indent=2, sort_keys=True))
+    return history
+
+
+async def run_with_result_cache(
+    config: TestMatrixConfig,
+    code_sha: str,
+    run_test: Callable[[TestMatrixConfig], Awaitable[TestResult]],
+    cache_dir: Path = RESULT_CACHE_DIR
+) -> TestResult:
+    """
+    Run a config unless a passing result for the same code revision is cached.
+    
+    Only successful results are cached, so failures are always re-run.
+    
+    Args:
+        config: Test matrix configuration to run
+        code_sha: Revision of the code under test
+        run_test: Coroutine function executing the config
+        cache_dir: Directory holding cached results
+        
+    Returns:
+        TestResult: Cached or freshly executed result
+    """
+    cache_path = Path(cache_dir) / f"{config.cache_key(code_sha)}.pickle"
+    try:
+        with cache_path.open("rb") as cache_file:
+            return pickle.load(cache_file)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        # Truncated, corrupt or written by an incompatible TestResult layout;
+        # drop it and re-run the config
+        cache_path.unlink(missing_ok=True)
+    
+    result = await run_test(config)
+    if result.success:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = cache_path.with_suffix(".tmp")
+        with partial_path.open("wb") as cache_file:
+            pickle.dump(result, cache_file)
+        partial_path.replace(cache_path)
+    
+    return result
+
+
+def revision_sampler(seed: Optional[str] = None) -> VersionSampler:
+    """
+    Create a sampler that tests one version per axis, chosen per code revision.
+    
+    The choice is deterministic for a given seed, so re-runs of the same
+    revision test the same slice, while successive revisions cover the
+    whole version space over time.
+    
+    Args:
+        seed: Seed for the choice (default: the GITHUB_SHA environment variable)
+        
+    Returns:
+        VersionSampler: Sampler returning a single version from each axis
+    """
+    if seed is None:
+        seed = os.environ.get("GITHUB_SHA", "")
+    rng = random.Random(seed)
+    return lambda versions: [rng.choice(versions)]
+
+
+def _merge_batch(configs: List[TestMatrixConfig]) -> TestMatrixConfig:
+    """Merge configs sharing one image into a single config running all of them."""
+    if len(configs) == 1:
+        return configs[0]
+    
+    return replace(
+        configs[0],
+        test_types=tuple(dict.fromkeys(t for config in configs for t in config.test_types)),
+        server_configs=list(dict.fromkeys(s for config in configs for s in config.server_configs)),
+        timeout_seconds=sum(config.timeout_seconds for config in configs),
+        retry_count=max(config.retry_count for config in configs),
+        parallel_execution=all(config.parallel_execution for config in configs)
+    )
+
+
 class TestMatrixBuilder:
     """
     Builder for creating comprehensive test matrices.
@@ -101,13 +314,16 @@ class TestMatrixBuilder:
         if test_types is None:
             test_types = [TestType.FUNCTIONAL]
         
-        for version in versions:
-            config = TestMatrixConfig(
+        # One immutable tuple shared by every config added here
+        shared_types = tuple(test_types)
+        self.configs.extend(
+            TestMatrixConfig(
                 environment=TestEnvironment.PYTHON_ONLY,
                 python_version=version,
-                test_types=test_types.copy()
+                test_types=shared_types
             )
-            self.configs.append(config)
+            for version in versions
+        )
         
         return self
     
@@ -131,13 +347,15 @@ class TestMatrixBuilder:
         if test_types is None:
             test_types = [TestType.FUNCTIONAL]
         
-        for version in versions:
-            config = TestMatrixConfig(
+        shared_types = tuple(test_types)
+        self.configs.extend(
+            TestMatrixConfig(
                 environment=TestEnvironment.NODEJS_ONLY,
                 node_version=version,
-                test_types=test_types.copy()
+                test_types=shared_types
             )
-            self.configs.append(config)
+            for version in versions
+        )
         
         return self
     
@@ -145,7 +363,8 @@ class TestMatrixBuilder:
         self,
         python_versions: List[str] = None,
         node_versions: List[str] = None,
-        test_types: List[TestType] = None
+        test_types: List[TestType] = None,
+        sampler: Optional[VersionSampler] = None
     ) -> 'TestMatrixBuilder':
         """
         Add multi-language test environments to the matrix.
@@ -154,6 +373,7 @@ class TestMatrixBuilder:
             python_versions: Python versions to test (default: ["3.12"])
             node_versions: Node.js versions to test (default: ["20"])
             test_types: Test types to run (default: [INTEGRATION])
+            sampler: Optional sampler applied to each version axis (default: all versions)
             
         Returns:
             TestMatrixBuilder: Self for method chaining
@@ -164,16 +384,20 @@ class TestMatrixBuilder:
             node_versions = ["20"]
         if test_types is None:
             test_types = [TestType.INTEGRATION]
+        if sampler is not None:
+            python_versions = sampler(python_versions)
+            node_versions = sampler(node_versions)
         
-        for py_version in python_versions:
-            for node_version in node_versions:
-                config = TestMatrixConfig(
-                    environment=TestEnvironment.MULTI_LANGUAGE,
-                    python_version=py_version,
-                    node_version=node_version,
-                    test_types=test_types.copy()
-                )
-                self.configs.append(config)
+        shared_types = tuple(test_types)
+        self.configs.extend(
+            TestMatrixConfig(
+                environment=TestEnvironment.MULTI_LANGUAGE,
+                python_version=py_version,
+                node_version=node_version,
+                test_types=shared_types
+            )
+            for py_version, node_version in product(python_versions, node_versions)
+        )
         
         return self
     
@@ -193,53 +417,100 @@ class TestMatrixBuilder:
         if environments is None:
             environments = [TestEnvironment.PYTHON_ONLY, TestEnvironment.MULTI_LANGUAGE]
         
-        for env in environments:
-            if env == TestEnvironment.PYTHON_ONLY:
-                config = TestMatrixConfig(
-                    environment=env,
-                    python_version="3.12",
-                    test_types=[TestType.PERFORMANCE],
-                    timeout_seconds=600  # Longer timeout for performance tests
-                )
-            elif env == TestEnvironment.NODEJS_ONLY:
-                config = TestMatrixConfig(
-                    environment=env,
-                    node_version="20",
-                    test_types=[TestType.PERFORMANCE],
-                    timeout_seconds=600
-                )
-            else:  # MULTI_LANGUAGE
-                config = TestMatrixConfig(
-                    environment=env,
-                    python_version="3.12",
-                    node_version="20",
-                    test_types=[TestType.PERFORMANCE],
-                    timeout_seconds=600
-                )
-            
-            self.configs.append(config)
+        self.configs.extend(
+            TestMatrixConfig(
+                environment=env,
+                test_types=(TestType.PERFORMANCE,),
+                timeout_seconds=600,
+                **PERFORMANCE_DEFAULTS[env]
+            )
+            for env in environments
+        )
         
         return self
     
-    def add_compatibility_matrix(self) -> 'TestMatrixBuilder':
+    def add_compatibility_matrix(
+        self,
+        python_versions: List[str] = None,
+        sampler: Optional[VersionSampler] = None
+    ) -> 'TestMatrixBuilder':
         """
         Add compatibility testing configurations.
         
+        Args:
+            python_versions: Python versions to test (default: ["3.11", "3.12", "3.13"])
+            sampler: Optional sampler applied to the Python versions (default: all versions)
+            
         Returns:
             TestMatrixBuilder: Self for method chaining
         """
         # Test multiple Python versions for compatibility
-        python_versions = ["3.11", "3.12", "3.13"]
+        if python_versions is None:
+            python_versions = ["3.11", "3.12", "3.13"]
+        if sampler is not None:
+            python_versions = sampler(python_versions)
         
-        for version in python_versions:
-            config = TestMatrixConfig(
+        self.configs.extend(
+            TestMatrixConfig(
                 environment=TestEnvironment.PYTHON_ONLY,
                 python_version=version,
-                test_types=[TestType.COMPATIBILITY],
+                test_types=(TestType.COMPATIBILITY,),
                 timeout_seconds=180
             )
-            self.configs.append(config)
+            for version in python_versions
+        )
+        
+        return self
+    
+    def add_timed_batches(self, budget_seconds: int, history_path: Path) -> 'TestMatrixBuilder':
+        """
+        Pack the configs added so far into batches that fit a time budget.
+        
+        Configs sharing a container image and environment variables are
+        bin-packed first-fit decreasing by their historical runtime, and
+        each bin is merged into one config running all of its test types.
+        Configs without history are estimated at their timeout.
+        
+        Args:
+            budget_seconds: Target wall-clock budget per batch
+            history_path: JSON duration history written by record_execution_times
+            
+        Returns:
+            TestMatrixBuilder: Self for method chaining
+        """
+        history = load_duration_history(history_path)
+        
+        groups: Dict[Tuple[Any, ...], List[TestMatrixConfig]] = defaultdict(list)
+        for config in self.build():
+            groups[(
+                config.environment,
+                config.python_version,
+                config.node_version,
+                tuple(sorted(config.environment_variables.items()))
+            )].append(config)
+        
+        batched = []
+        for group in groups.values():
+            estimates = sorted(
+                ((_estimated_duration(config, history), config) for config in group),
+                key=lambda item: item[0],
+                reverse=True
+            )
+            
+            # Each bin is [remaining budget, configs]
+            bins: List[List[Any]] = []
+            for estimate, config in estimates:
+                for bin_ in bins:
+                    if estimate <= bin_[0]:
+                        bin_[0] -= estimate
+                        bin_[1].append(config)
+                        break
+                else:
+                    bins.append([budget_seconds - estimate, [config]])
+            
+            batched.extend(_merge_batch(configs) for _, configs in bins)
         
+        self.configs = batched
         return self
     
     def with_custom_config(self, config: TestMatrixConfig) -> 'TestMatrixBuilder':
@@ -255,14 +526,76 @@ class TestMatrixBuilder:
         self.configs.append(config)
         return self
     
+    def iter_configs(self) -> Iterator[TestMatrixConfig]:
+        """
+        Stream the test matrix without materializing it.
+        
+        Exact duplicates (same environment and test types) are skipped as
+        they are reached, so an executor can start provisioning containers
+        for early configs immediately. Unlike build(), partially overlapping
+        configs are not merged, since that needs the whole matrix.
+        
+        Yields:
+            TestMatrixConfig: Test matrix configurations in insertion order
+        """
+        seen = set()
+        for config in self.configs:
+            identity = (config._key, config.test_types)
+            if identity not in seen:
+                seen.add(identity)
+                yield config
+    
     def build(self) -> List[TestMatrixConfig]:
         """
         Build and return the complete test matrix.
         
+        Configurations that would run in an identical environment are
+        collapsed into one entry running the union of their test types,
+        so the same container is never provisioned twice.
+        
         Returns:
             List[TestMatrixConfig]: Complete test matrix configurations
         """
-        return self.configs.copy()
+        unique: Dict[Tuple[Any, ...], TestMatrixConfig] = {}
+        for config in self.iter_configs():
+            key = config._key
+            existing = unique.get(key)
+            if existing is None:
+                unique[key] = config
+                continue
+            
+            new_types = tuple(t for t in config.test_types if t not in existing.test_types)
+            if new_types:
+                unique[key] = replace(existing, test_types=existing.test_types + new_types)
+        
+        return list(unique.values())
+    
+    def build_batched(self) -> Dict[ImageKey, List[TestMatrixConfig]]:
+        """
+        Build the test matrix grouped by the container image each config needs.
+        
+        Configs in the same group can share one container and run all of
+        their test types there instead of provisioning a container each.
+        
+        Returns:
+            Dict[ImageKey, List[TestMatrixConfig]]: Configurations keyed by image
+        """
+        batches: Dict[ImageKey, List[TestMatrixConfig]] = defaultdict(list)
+        for config in self.build():
+            batches[(config.environment, config.python_version, config.node_version)].append(config)
+        
+        return dict(batches)
+
+
+def _memoized_matrix(factory: Callable[[], List[TestMatrixConfig]]) -> Callable[[], List[TestMatrixConfig]]:
+    """Build a predefined matrix once and hand each caller its own list copy."""
+    build_once = lru_cache(maxsize=None)(lambda: tuple(factory()))
+    
+    @wraps(factory)
+    def matrix() -> List[TestMatrixConfig]:
+        return list(build_once())
+    
+    return matrix
 
 
 class DefaultTestMatrices:
@@ -274,6 +607,7 @@ class DefaultTestMatrices:
     """
     
     @staticmethod
+    @_memoized_matrix
     def basic_functional() -> List[TestMatrixConfig]:
         """
         Create a basic functional test matrix.
@@ -289,12 +623,37 @@ class DefaultTestMatrices:
         )
     
     @staticmethod
-    def comprehensive() -> List[TestMatrixConfig]:
+    def _pr_sparse_builder() -> TestMatrixBuilder:
+        """Builder for the sparse bookend matrix, shared by the pull request factories."""
+        return (
+            TestMatrixBuilder()
+            .add_python_environments(["3.11", "3.13"], [TestType.FUNCTIONAL])
+            .add_nodejs_environments(["18", "22"], [TestType.FUNCTIONAL])
+            .add_multi_language_environments(["3.13"], ["22"], [TestType.INTEGRATION])
+        )
+    
+    @staticmethod
+    @_memoized_matrix
+    def pr_sparse() -> List[TestMatrixConfig]:
         """
-        Create a comprehensive test matrix covering all scenarios.
+        Create a sparse test matrix for pull requests.
+        
+        Only the oldest supported and latest stable versions are tested
+        ("bookends"); mid versions are left to the nightly exhaustive matrix.
         
         Returns:
-            List[TestMatrixConfig]: Comprehensive test configurations
+            List[TestMatrixConfig]: Sparse bookend test configurations
+        """
+        return DefaultTestMatrices._pr_sparse_builder().build()
+    
+    @staticmethod
+    @_memoized_matrix
+    def nightly_exhaustive() -> List[TestMatrixConfig]:
+        """
+        Create the exhaustive test matrix for scheduled (nightly) runs.
+        
+        Returns:
+            List[TestMatrixConfig]: Exhaustive test configurations
         """
         return (
             TestMatrixBuilder()
@@ -307,6 +666,30 @@ class DefaultTestMatrices:
         )
     
     @staticmethod
+    def comprehensive() -> List[TestMatrixConfig]:
+        """
+        Create the default matrix for the "comprehensive" scenario.
+        
+        This is the sparse pull request matrix, equivalent to pr_sparse();
+        use nightly_exhaustive() to test every version.
+        
+        Returns:
+            List[TestMatrixConfig]: Comprehensive test configurations
+        """
+        return DefaultTestMatrices.pr_sparse()
+    
+    @staticmethod
+    def comprehensive_batched() -> Dict[ImageKey, List[TestMatrixConfig]]:
+        """
+        Create the comprehensive (sparse pull request) matrix grouped by container image.
+        
+        Returns:
+            Dict[ImageKey, List[TestMatrixConfig]]: Comprehensive configurations keyed by image
+        """
+        return DefaultTestMatrices._pr_sparse_builder().build_batched()
+    
+    @staticmethod
+    @_memoized_matrix
     def performance_focused() -> List[TestMatrixConfig]:
         """
         Create a performance-focused test matrix.
@@ -322,28 +705,48 @@ class DefaultTestMatrices:
         )
     
     @staticmethod
+    @_memoized_matrix
     def compatibility_focused() -> List[TestMatrixConfig]:
         """
         Create a compatibility-focused test matrix.
         
+        One Python and one Node.js version are sampled per code revision
+        rather than testing the full cross-product on every run. The sampled
+        Python version is used for both the functional and compatibility runs.
+        
         Returns:
             List[TestMatrixConfig]: Compatibility test configurations
         """
+        sample = revision_sampler()
+        python_versions = sample(["3.11", "3.12", "3.13"])
+        node_versions = sample(["18", "20", "22"])
         return (
             TestMatrixBuilder()
-            .add_python_environments(["3.11", "3.12", "3.13"], [TestType.FUNCTIONAL])
-            .add_nodejs_environments(["18", "20", "22"], [TestType.FUNCTIONAL])
-            .add_compatibility_matrix()
+            .add_python_environments(python_versions, [TestType.FUNCTIONAL])
+            .add_nodejs_environments(node_versions, [TestType.FUNCTIONAL])
+            .add_compatibility_matrix(python_versions)
             .build()
         )
 
 
+# Predefined matrix factory for each scenario name
+SCENARIO_MATRICES: Dict[str, Callable[[], List[TestMatrixConfig]]] = {
+    "basic": DefaultTestMatrices.basic_functional,
+    "comprehensive": DefaultTestMatrices.pr_sparse,
+    "nightly": DefaultTestMatrices.nightly_exhaustive,
+    "performance": DefaultTestMatrices.performance_focused,
+    "compatibility": DefaultTestMatrices.compatibility_focused
+}
+AVAILABLE_SCENARIOS = ", ".join(SCENARIO_MATRICES)
+
+
 def get_test_matrix_for_scenario(scenario: str) -> List[TestMatrixConfig]:
     """
     Get a predefined test matrix for a specific scenario.
     
     Args:
-        scenario: Test scenario name ("basic", "comprehensive", "performance", "compatibility")
+        scenario: Test scenario name ("basic", "comprehensive", "nightly", "performance", "compatibility");
+            "comprehensive" is the sparse pull request matrix, "nightly" the exhaustive one
         
     Returns:
         List[TestMatrixConfig]: Test matrix configurations for the scenario
@@ -351,26 +754,23 @@ def get_test_matrix_for_scenario(scenario: str) -> List[TestMatrixConfig]:
     Raises:
         ValueError: If scenario is not recognized
     """
-    scenarios = {
-        "basic": DefaultTestMatrices.basic_functional,
-        "comprehensive": DefaultTestMatrices.comprehensive,
-        "performance": DefaultTestMatrices.performance_focused,
-        "compatibility": DefaultTestMatrices.compatibility_focused
-    }
+    try:
+        factory = SCENARIO_MATRICES[scenario]
+    except KeyError:
+        raise ValueError(
+            f"Unknown scenario '{scenario}'. Available: {AVAILABLE_SCENARIOS}"
+        ) from None
     
-    if scenario not in scenarios:
-        available = ", ".join(scenarios.keys())
-        raise ValueError(f"Unknown scenario '{scenario}'. Available: {available}")
-    
-    return scenarios[scenario]()
+    return factory()
 
 
-def format_test_matrix_summary(configs: List[TestMatrixConfig]) -> str:
+def format_test_matrix_summary(configs: List[TestMatrixConfig], use_emoji: bool = True) -> str:
     """
     Format a test matrix summary for display.
     
     Args:
         configs: Test matrix configurations
+        use_emoji: Use emoji section markers (ASCII markers otherwise)
         
     Returns:
         str: Formatted summary of the test matrix
@@ -378,45 +778,40 @@ def format_test_matrix_summary(configs: List[TestMatrixConfig]) -> str:
     if not configs:
         return "No test configurations in matrix"
     
-    summary = f"Test Matrix Summary ({len(configs)} configurations):\n"
-    summary += "=" * 50 + "\n\n"
-    
-    # Group by environment
-    env_groups = {}
-    for config in configs:
-        env_name = config.environment.value
-        if env_name not in env_groups:
-            env_groups[env_name] = []
-        env_groups[env_name].append(config)
+    parts: List[str] = [
+        f"Test Matrix Summary ({len(configs)} configurations):\n",
+        "=" * 50 + "\n\n"
+    ]
+    append = parts.append
+    icons = SUMMARY_ICONS if use_emoji else SUMMARY_ASCII_ICONS
+    env_icon = icons["environment"]
     
-    for env_name, env_configs in env_groups.items():
-        summary += f"🔧 {env_name.upper()} Environment ({len(env_configs)} configs):\n"
+    # Group by environment; the sort is stable, so configs keep their
+    # matrix order within each group
+    unique_envs = 0
+    sorted_configs = sorted(configs, key=lambda c: ENVIRONMENT_ORDER[c.environment])
+    for environment, group in groupby(sorted_configs, key=lambda c: c.environment):
+        env_configs = list(group)
+        unique_envs += 1
+        append(f"{env_icon} {environment.value.upper()} Environment ({len(env_configs)} configs):\n")
         
         for i, config in enumerate(env_configs, 1):
-            summary += f"   {i}. "
-            
-            if config.python_version:
-                summary += f"Python {config.python_version} "
-            if config.node_version:
-                summary += f"Node.js {config.node_version} "
-            
-            test_types = [t.value for t in config.test_types]
-            summary += f"- Tests: {', '.join(test_types)}"
-            
-            if config.timeout_seconds != 300:
-                summary += f" (timeout: {config.timeout_seconds}s)"
-            
-            summary += "\n"
+            python = f"Python {config.python_version} " if config.python_version else ""
+            node = f"Node.js {config.node_version} " if config.node_version else ""
+            timeout = f" (timeout: {config.timeout_seconds}s)" if config.timeout_seconds != 300 else ""
+            test_types = ", ".join(t.value for t in config.test_types)
+            append(f"   {i}. {python}{node}- Tests: {test_types}{timeout}\n")
         
-        summary += "\n"
+        append("\n")
     
     # Overall statistics
     total_tests = sum(len(config.test_types) for config in configs)
-    unique_envs = len(env_groups)
     
-    summary += f"📊 Statistics:\n"
-    summary += f"   Total Configurations: {len(configs)}\n"
-    summary += f"   Total Test Types: {total_tests}\n"
-    summary += f"   Unique Environments: {unique_envs}\n"
+    append(
+        f"{icons['statistics']} Statistics:\n"
+        f"   Total Configurations: {len(configs)}\n"
+        f"   Total Test Types: {total_tests}\n"
+        f"   Unique Environments: {unique_envs}\n"
+    )
     
-    return summary 
\ No newline at end of file
+    return "".join(parts)
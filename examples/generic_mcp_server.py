@@ -13,12 +13,18 @@ This example demonstrates:
 - Testing integration
 """
 
+import ast
 import asyncio
+import inspect
 import json
 import logging
+import operator
 import sys
+from functools import lru_cache
+from types import CodeType
 from typing import Any, Dict, List, Optional, Sequence
 
+from jsonschema import Draft7Validator, ValidationError
 from mcp import ClientSession, StdioServerParameters
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
@@ -36,194 +42,337 @@ from mcp.types import (
     Tool,
 )
 
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speed-up for resource reads; fall back to stdlib json
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop is an optional faster event loop; fall back to asyncio's default
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Tools exposed by the server; built once at import and shared by every
+# list_tools response
+TOOLS = (
+    Tool(
+        name="echo",
+        description="Echo back the provided text",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "Text to echo back"
+                }
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="calculate",
+        description="Perform basic mathematical calculations",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "expression": {
+                    "type": "string",
+                    "description": "Mathematical expression to evaluate (e.g., '2 + 2')"
+                }
+            },
+            "required": ["expression"]
+        }
+    ),
+    Tool(
+        name="store_data",
+        description="Store data with a key",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {
+                    "type": "string",
+                    "description": "Key to store data under"
+                },
+                "value": {
+                    "type": "string",
+                    "description": "Value to store"
+                }
+            },
+            "required": ["key", "value"]
+        }
+    ),
+    Tool(
+        name="get_data",
+        description="Retrieve stored data by key",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {
+                    "type": "string",
+                    "description": "Key to retrieve data for"
+                }
+            },
+            "required": ["key"]
+        }
+    ),
+    Tool(
+        name="mget",
+        description="Retrieve the data stored under several keys at once",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "keys": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Keys to retrieve data for"
+                }
+            },
+            "required": ["keys"]
+        }
+    ),
+    Tool(
+        name="mput",
+        description="Store several key/value pairs at once",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "items": {
+                    "type": "object",
+                    "additionalProperties": {"type": "string"},
+                    "description": "Values to store, by key"
+                }
+            },
+            "required": ["items"]
+        }
+    ),
+    Tool(
+        name="list_keys",
+        description="List all stored data keys",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False
+        }
+    ),
+    Tool(
+        name="batch_execute",
+        description="Run several tool calls concurrently in a single request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Tool calls to run",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": "Name of the tool to call"
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Arguments for the tool"
+                            }
+                        },
+                        "required": ["name"]
+                    }
+                },
+                "stopOnError": {
+                    "type": "boolean",
+                    "description": "Cancel the remaining calls once one fails"
+                }
+            },
+            "required": ["calls"]
+        }
+    )
+)
+
+# Stores with more items than this are serialized in a worker thread so a
+# large memory://data read doesn't hold up other requests
+LARGE_STORE_ITEMS = 1000
+
+# Resources exposed by the server; built once at import and shared by every
+# list_resources response
+RESOURCES = (
+    Resource(
+        uri="memory://data",
+        name="Data Store",
+        description="Current data store contents",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="memory://stats",
+        name="Server Statistics",
+        description="Server runtime statistics",
+        mimeType="application/json"
+    )
+)
+
+# Deletes every character a calculate expression may contain, so anything
+# left over after translate() is not allowed
+EXPRESSION_CHARS_TABLE = str.maketrans("", "", "0123456789+-*/.() ")
+
+# Syntax a calculate expression may use: numbers, + - * / // ** and parentheses
+ALLOWED_EXPRESSION_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Constant,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Pow,
+    ast.USub,
+    ast.UAdd,
+)
+
+# Largest exponent ** accepts. Exponents must be literal numbers and bases may
+# not contain another **, so a tiny expression can't demand an enormous result
+MAX_EXPONENT = 100
+
+
+def _check_power(node: ast.BinOp) -> None:
+    """Reject a ** whose result could grow without bound."""
+    exponent = node.right
+    if isinstance(exponent, ast.UnaryOp):
+        exponent = exponent.operand
+    if not (
+        isinstance(exponent, ast.Constant)
+        and isinstance(exponent.value, (int, float))
+        and abs(exponent.value) <= MAX_EXPONENT
+    ):
+        raise ValueError(f"exponent must be a number between -{MAX_EXPONENT} and {MAX_EXPONENT}")
+    if any(isinstance(inner, ast.Pow) for inner in ast.walk(node.left)):
+        raise ValueError("the base of ** cannot contain another **")
+
+
+@lru_cache(maxsize=512)
+def _compile_expression(expression: str) -> CodeType:
+    """Parse, check and compile a calculate expression; repeated expressions reuse the code object."""
+    tree = ast.parse(expression, mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, ALLOWED_EXPRESSION_NODES):
+            raise ValueError(f"unsupported syntax: {type(node).__name__}")
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            _check_power(node)
+    return compile(tree, "<expr>", "eval")
+
+
+# Pulls both store_data arguments out in one call
+_KEY_AND_VALUE = operator.itemgetter("key", "value")
+
+# Marks a missing key in data_store lookups, where None is a storable value
+_MISSING = object()
+
+
+def _call_tool_options() -> Dict[str, Any]:
+    """
+    Options for registering the call_tool handler.
+    
+    Tool arguments are checked against precompiled validators in _execute,
+    so skip the per-call jsonschema.validate that newer mcp servers run on
+    top of that. Older releases don't have the option.
+    """
+    call_tool = getattr(Server, "call_tool", None)
+    if call_tool is not None and "validate_input" in inspect.signature(call_tool).parameters:
+        return {"validate_input": False}
+    return {}
+
+
+def _text_content(text: str) -> TextContent:
+    """
+    Build a text content item without running pydantic validation.
+    
+    Tool results are built from strings the server produced itself, so the
+    per-item validation of TextContent(...) buys nothing on the call path.
+    """
+    return TextContent.model_construct(type="text", text=text)
+
+
+def _dumps(data: Any) -> str:
+    """Serialize data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
 class GenericMCPServer:
     """Generic MCP Server implementation."""
     
     def __init__(self):
         self.server = Server("generic-mcp-server")
         self.data_store = {}
+        # Serialized data_store for memory://data reads; None until the
+        # next read after a store_data call
+        self._data_json_cache: Optional[str] = None
+        # Bumped on every store so a serialization that finishes after a
+        # newer store doesn't repopulate the cache with stale data
+        self._data_version = 0
+        # Joined key list for list_keys; None until the next list_keys call
+        # after a new key is stored
+        self._keys_cache: Optional[str] = ""
+        # Compile each tool's input schema once instead of per call
+        self._validators = {tool.name: Draft7Validator(tool.inputSchema) for tool in TOOLS}
+        # Tool name -> implementation, one entry per tool in TOOLS
+        self._tools = {
+            "echo": self._tool_echo,
+            "calculate": self._tool_calculate,
+            "store_data": self._tool_store_data,
+            "get_data": self._tool_get_data,
+            "mget": self._tool_mget,
+            "mput": self._tool_mput,
+            "list_keys": self._tool_list_keys,
+            "batch_execute": self._tool_batch_execute,
+        }
         self.setup_handlers()
     
     def setup_handlers(self):
         """Set up MCP server handlers."""
         
         @self.server.list_tools()
-        async def handle_list_tools() -> List[Tool]:
+        async def handle_list_tools() -> Sequence[Tool]:
             """List available tools."""
-            return [
-                Tool(
-                    name="echo",
-                    description="Echo back the provided text",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "text": {
-                                "type": "string",
-                                "description": "Text to echo back"
-                            }
-                        },
-                        "required": ["text"]
-                    }
-                ),
-                Tool(
-                    name="calculate",
-                    description="Perform basic mathematical calculations",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "expression": {
-                                "type": "string",
-                                "description": "Mathematical expression to evaluate (e.g., '2 + 2')"
-                            }
-                        },
-                        "required": ["expression"]
-                    }
-                ),
-                Tool(
-                    name="store_data",
-                    description="Store data with a key",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "key": {
-                                "type": "string",
-                                "description": "Key to store data under"
-                            },
-                            "value": {
-                                "type": "string",
-                                "description": "Value to store"
-                            }
-                        },
-                        "required": ["key", "value"]
-                    }
-                ),
-                Tool(
-                    name="get_data",
-                    description="Retrieve stored data by key",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "key": {
-                                "type": "string",
-                                "description": "Key to retrieve data for"
-                            }
-                        },
-                        "required": ["key"]
-                    }
-                ),
-                Tool(
-                    name="list_keys",
-                    description="List all stored data keys",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "additionalProperties": False
-                    }
-                )
-            ]
+            return TOOLS
         
-        @self.server.call_tool()
-        async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
+        @self.server.call_tool(**_call_tool_options())
+        async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> Sequence[TextContent]:
             """Handle tool execution."""
-            try:
-                if name == "echo":
-                    text = arguments.get("text", "")
-                    return CallToolResult(
-                        content=[TextContent(type="text", text=f"Echo: {text}")]
-                    )
-                
-                elif name == "calculate":
-                    expression = arguments.get("expression", "")
-                    # Simple evaluation (in production, use a safer approach)
-                    try:
-                        # Only allow basic math operations for safety
-                        allowed_chars = set("0123456789+-*/.() ")
-                        if all(c in allowed_chars for c in expression):
-                            result = eval(expression)
-                            return CallToolResult(
-                                content=[TextContent(type="text", text=f"Result: {result}")]
-                            )
-                        else:
-                            return CallToolResult(
-                                content=[TextContent(type="text", text="Error: Invalid characters in expression")]
-                            )
-                    except Exception as e:
-                        return CallToolResult(
-                            content=[TextContent(type="text", text=f"Calculation error: {str(e)}")]
-                        )
-                
-                elif name == "store_data":
-                    key = arguments.get("key")
-                    value = arguments.get("value")
-                    self.data_store[key] = value
-                    return CallToolResult(
-                        content=[TextContent(type="text", text=f"Stored '{value}' under key '{key}'")]
-                    )
-                
-                elif name == "get_data":
-                    key = arguments.get("key")
-                    if key in self.data_store:
-                        value = self.data_store[key]
-                        return CallToolResult(
-                            content=[TextContent(type="text", text=f"Value for '{key}': {value}")]
-                        )
-                    else:
-                        return CallToolResult(
-                            content=[TextContent(type="text", text=f"No data found for key '{key}'")]
-                        )
-                
-                elif name == "list_keys":
-                    keys = list(self.data_store.keys())
-                    if keys:
-                        return CallToolResult(
-                            content=[TextContent(type="text", text=f"Stored keys: {', '.join(keys)}")]
-                        )
-                    else:
-                        return CallToolResult(
-                            content=[TextContent(type="text", text="No data stored")]
-                        )
-                
-                else:
-                    return CallToolResult(
-                        content=[TextContent(type="text", text=f"Unknown tool: {name}")],
-                        isError=True
-                    )
-            
-            except Exception as e:
-                logger.error(f"Error executing tool {name}: {e}")
-                return CallToolResult(
-                    content=[TextContent(type="text", text=f"Tool execution error: {str(e)}")],
-                    isError=True
-                )
+            # Only recent mcp releases pass a returned CallToolResult through;
+            # every release accepts bare content and turns a raised error into
+            # an isError result carrying its message
+            result = await self._execute(name, arguments)
+            if result.isError:
+                raise RuntimeError("\n".join(item.text for item in result.content))
+            return result.content
         
         @self.server.list_resources()
-        async def handle_list_resources() -> List[Resource]:
+        async def handle_list_resources() -> Sequence[Resource]:
             """List available resources."""
-            return [
-                Resource(
-                    uri="memory://data",
-                    name="Data Store",
-                    description="Current data store contents",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="memory://stats",
-                    name="Server Statistics",
-                    description="Server runtime statistics",
-                    mimeType="application/json"
-                )
-            ]
+            return RESOURCES
         
         @self.server.read_resource()
         async def handle_read_resource(uri: str) -> ReadResourceResult:
             """Read resource content."""
             try:
                 if uri == "memory://data":
-                    content = json.dumps(self.data_store, indent=2)
+                    content = self._data_json_cache
+                    if content is None:
+                        if len(self.data_store) > LARGE_STORE_ITEMS:
+                            version = self._data_version
+                            content = await asyncio.to_thread(_dumps, dict(self.data_store))
+                            if version == self._data_version:
+                                self._data_json_cache = content
+                        else:
+                            content = self._data_json_cache = _dumps(self.data_store)
                     return ReadResourceResult(
                         contents=[TextContent(type="text", text=content)]
                     )
@@ -234,7 +383,7 @@ class GenericMCPServer:
                         "server_name": "generic-mcp-server",
                         "status": "running"
                     }
-                    content = json.dumps(stats, indent=2)
+                    content = _dumps(stats)
                     return ReadResourceResult(
                         contents=[TextContent(type="text", text=content)]
                     )
@@ -251,6 +400,164 @@ class GenericMCPServer:
                     contents=[TextContent(type="text", text=f"Resource read error: {str(e)}")],
                     isError=True
                 )
+    
+    async def _execute(self, name: str, arguments: Dict[str, Any]) -> CallToolResult:
+        """
+        Validate arguments and run a tool, turning failures into error results.
+        
+        Tools only run with arguments that passed their schema, so they can
+        index required arguments directly.
+        """
+        handler = self._tools.get(name)
+        if handler is None:
+            return CallToolResult(
+                content=[_text_content(f"Unknown tool: {name}")],
+                isError=True
+            )
+        
+        try:
+            self._validators[name].validate(arguments)
+            return await handler(arguments)
+        
+        except ValidationError as e:
+            return CallToolResult(
+                content=[_text_content(f"Invalid arguments for {name}: {e.message}")],
+                isError=True
+            )
+        
+        except Exception as e:
+            logger.error(f"Error executing tool {name}: {e}")
+            return CallToolResult(
+                content=[_text_content(f"Tool execution error: {str(e)}")],
+                isError=True
+            )
+    
+    async def _tool_echo(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """Echo back the provided text."""
+        text = arguments["text"]
+        return CallToolResult(
+            content=[_text_content("Echo: " + text)]
+        )
+    
+    async def _tool_calculate(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """Evaluate a basic arithmetic expression."""
+        expression = arguments["expression"]
+        try:
+            # Only allow basic math operations for safety
+            if not expression.translate(EXPRESSION_CHARS_TABLE):
+                result = eval(_compile_expression(expression), {"__builtins__": {}}, {})
+                return CallToolResult(
+                    content=[_text_content(f"Result: {result}")]
+                )
+            else:
+                return CallToolResult(
+                    content=[_text_content("Error: Invalid characters in expression")]
+                )
+        except Exception as e:
+            return CallToolResult(
+                content=[_text_content(f"Calculation error: {str(e)}")]
+            )
+    
+    async def _tool_store_data(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """Store a value under a key."""
+        key, value = _KEY_AND_VALUE(arguments)
+        if key not in self.data_store:
+            self._keys_cache = None
+        self.data_store[key] = value
+        self._data_json_cache = None
+        self._data_version += 1
+        return CallToolResult(
+            content=[_text_content(f"Stored '{value}' under key '{key}'")]
+        )
+    
+    async def _tool_get_data(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """Retrieve the value stored under a key."""
+        key = arguments["key"]
+        value = self.data_store.get(key, _MISSING)
+        if value is not _MISSING:
+            return CallToolResult(
+                content=[_text_content(f"Value for '{key}': {value}")]
+            )
+        else:
+            return CallToolResult(
+                content=[_text_content(f"No data found for key '{key}'")]
+            )
+    
+    async def _tool_mget(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """Retrieve several values as one JSON object; missing keys map to null."""
+        data_store = self.data_store
+        values = {key: data_store.get(key) for key in arguments["keys"]}
+        return CallToolResult(
+            content=[_text_content(_dumps(values))]
+        )
+    
+    async def _tool_mput(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """Store several key/value pairs."""
+        items = arguments["items"]
+        if not self.data_store.keys() >= items.keys():
+            self._keys_cache = None
+        self.data_store.update(items)
+        self._data_json_cache = None
+        self._data_version += 1
+        return CallToolResult(
+            content=[_text_content(f"Stored {len(items)} items")]
+        )
+    
+    async def _tool_list_keys(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """List all stored keys."""
+        if self._keys_cache is None:
+            self._keys_cache = ", ".join(self.data_store)
+        if self._keys_cache:
+            return CallToolResult(
+                content=[_text_content(f"Stored keys: {self._keys_cache}")]
+            )
+        else:
+            return CallToolResult(
+                content=[_text_content("No data stored")]
+            )
+    
+    async def _tool_batch_execute(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """
+        Run several tool calls concurrently and combine their results.
+        
+        Each call's output is prefixed with its position and tool name. With
+        stopOnError, calls still running when one fails are cancelled.
+        """
+        calls = arguments["calls"]
+        if any(call["name"] == "batch_execute" for call in calls):
+            return CallToolResult(
+                content=[_text_content("Error: batch_execute calls cannot be nested")],
+                isError=True
+            )
+        
+        tasks = [
+            asyncio.ensure_future(self._execute(call["name"], call.get("arguments", {})))
+            for call in calls
+        ]
+        if arguments.get("stopOnError", False):
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if any(task.result().isError for task in done):
+                    for task in pending:
+                        task.cancel()
+                    break
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
+        content = []
+        for index, (call, task) in enumerate(zip(calls, tasks)):
+            prefix = f"[{index}] {call['name']}: "
+            if task.cancelled():
+                content.append(_text_content(prefix + "Skipped after an earlier error"))
+            else:
+                content.extend(
+                    _text_content(prefix + item.text) for item in task.result().content
+                )
+        return CallToolResult(
+            content=content,
+            isError=any(task.cancelled() or task.result().isError for task in tasks)
+        )
+
 
 async def main():
     """Main server entry point."""
@@ -302,4 +609,7 @@ if __name__ == "__main__":
             sys.exit(0)
     
     # Run the server
-    asyncio.run(main()) 
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main()) 
\ No newline at end of file
@@ -13,11 +13,14 @@ This example demonstrates:
 - Testing integration
 """
 
+import ast
 import asyncio
 import json
 import logging
 import sys
-from typing import Any, Dict, List, Optional, Sequence
+from functools import lru_cache
+from types import CodeType
+from typing import Any, Dict, Optional, Sequence
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.server import Server
@@ -36,10 +39,164 @@ from mcp.types import (
     Tool,
 )
 
+try:
+    import uvloop
+except ImportError:
+    # uvloop is an optional faster event loop; fall back to asyncio's default
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Tools exposed by the server; built once at import and shared by every
+# list_tools response
+TOOLS = (
+    Tool(
+        name="echo",
+        description="Echo back the provided text",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "Text to echo back"
+                }
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="calculate",
+        description="Perform basic mathematical calculations",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "expression": {
+                    "type": "string",
+                    "description": "Mathematical expression to evaluate (e.g., '2 + 2')"
+                }
+            },
+            "required": ["expression"]
+        }
+    ),
+    Tool(
+        name="store_data",
+        description="Store data with a key",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {
+                    "type": "string",
+                    "description": "Key to store data under"
+                },
+                "value": {
+                    "type": "string",
+                    "description": "Value to store"
+                }
+            },
+            "required": ["key", "value"]
+        }
+    ),
+    Tool(
+        name="get_data",
+        description="Retrieve stored data by key",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {
+                    "type": "string",
+                    "description": "Key to retrieve data for"
+                }
+            },
+            "required": ["key"]
+        }
+    ),
+    Tool(
+        name="list_keys",
+        description="List all stored data keys",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False
+        }
+    )
+)
+
+# Stores with more items than this are serialized in a worker thread so a
+# large memory://data read doesn't hold up other requests
+LARGE_STORE_ITEMS = 1000
+
+# Deletes every character a calculate expression may contain, so anything
+# left over after translate() is not allowed
+EXPRESSION_CHARS_TABLE = str.maketrans("", "", "0123456789+-*/.() ")
+
+# Resources exposed by the server; built once at import and shared by every
+# list_resources response
+RESOURCES = (
+    Resource(
+        uri="memory://data",
+        name="Data Store",
+        description="Current data store contents",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="memory://stats",
+        name="Server Statistics",
+        description="Server runtime statistics",
+        mimeType="application/json"
+    )
+)
+
+
+# Syntax a calculate expression may use: numbers, + - * / // ** and parentheses
+ALLOWED_EXPRESSION_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Constant,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Pow,
+    ast.USub,
+    ast.UAdd,
+)
+
+# Largest exponent ** accepts. Exponents must be literal numbers and bases may
+# not contain another **, so a tiny expression can't demand an enormous result
+MAX_EXPONENT = 100
+
+
+def _check_power(node: ast.BinOp) -> None:
+    """Reject a ** whose result could grow without bound."""
+    exponent = node.right
+    if isinstance(exponent, ast.UnaryOp):
+        exponent = exponent.operand
+    if not (
+        isinstance(exponent, ast.Constant)
+        and isinstance(exponent.value, (int, float))
+        and abs(exponent.value) <= MAX_EXPONENT
+    ):
+        raise ValueError(f"exponent must be a number between -{MAX_EXPONENT} and {MAX_EXPONENT}")
+    if any(isinstance(inner, ast.Pow) for inner in ast.walk(node.left)):
+        raise ValueError("the base of ** cannot contain another **")
+
+
+@lru_cache(maxsize=512)
+def _compile_expression(expression: str) -> CodeType:
+    """Parse, check and compile a calculate expression; repeated expressions reuse the code object."""
+    tree = ast.parse(expression, mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, ALLOWED_EXPRESSION_NODES):
+            raise ValueError(f"unsupported syntax: {type(node).__name__}")
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            _check_power(node)
+    return compile(tree, "<expr>", "eval")
+
+
 class GenericMCPServer:
     """Generic MCP Server implementation."""
     
@@ -52,79 +209,9 @@ class GenericMCPServer:
         """Set up MCP server handlers."""
         
         @self.server.list_tools()
-        async def handle_list_tools() -> List[Tool]:
+        async def handle_list_tools() -> Sequence[Tool]:
             """List available tools."""
-            return [
-                Tool(
-                    name="echo",
-                    description="Echo back the provided text",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "text": {
-                                "type": "string",
-                                "description": "Text to echo back"
-                            }
-                        },
-                        "required": ["text"]
-                    }
-                ),
-                Tool(
-                    name="calculate",
-                    description="Perform basic mathematical calculations",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "expression": {
-                                "type": "string",
-                                "description": "Mathematical expression to evaluate (e.g., '2 + 2')"
-                            }
-                        },
-                        "required": ["expression"]
-                    }
-                ),
-                Tool(
-                    name="store_data",
-                    description="Store data with a key",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "key": {
-                                "type": "string",
-                                "description": "Key to store data under"
-                            },
-                            "value": {
-                                "type": "string",
-                                "description": "Value to store"
-                            }
-                        },
-                        "required": ["key", "value"]
-                    }
-                ),
-                Tool(
-                    name="get_data",
-                    description="Retrieve stored data by key",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "key": {
-                                "type": "string",
-                                "description": "Key to retrieve data for"
-                            }
-                        },
-                        "required": ["key"]
-                    }
-                ),
-                Tool(
-                    name="list_keys",
-                    description="List all stored data keys",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "additionalProperties": False
-                    }
-                )
-            ]
+            return TOOLS
         
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
@@ -138,12 +225,10 @@ class GenericMCPServer:
                 
                 elif name == "calculate":
                     expression = arguments.get("expression", "")
-                    # Simple evaluation (in production, use a safer approach)
                     try:
                         # Only allow basic math operations for safety
-                        allowed_chars = set("0123456789+-*/.() ")
-                        if all(c in allowed_chars for c in expression):
-                            result = eval(expression)
+                        if not expression.translate(EXPRESSION_CHARS_TABLE):
+                            result = eval(_compile_expression(expression), {"__builtins__": {}}, {})
                             return CallToolResult(
                                 content=[TextContent(type="text", text=f"Result: {result}")]
                             )
@@ -201,29 +286,19 @@ class GenericMCPServer:
                 )
         
         @self.server.list_resources()
-        async def handle_list_resources() -> List[Resource]:
+        async def handle_list_resources() -> Sequence[Resource]:
             """List available resources."""
-            return [
-                Resource(
-                    uri="memory://data",
-                    name="Data Store",
-                    description="Current data store contents",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="memory://stats",
-                    name="Server Statistics",
-                    description="Server runtime statistics",
-                    mimeType="application/json"
-                )
-            ]
+            return RESOURCES
         
         @self.server.read_resource()
         async def handle_read_resource(uri: str) -> ReadResourceResult:
             """Read resource content."""
             try:
                 if uri == "memory://data":
-                    content = json.dumps(self.data_store, indent=2)
+                    if len(self.data_store) > LARGE_STORE_ITEMS:
+                        content = await asyncio.to_thread(json.dumps, dict(self.data_store), indent=2)
+                    else:
+                        content = json.dumps(self.data_store, indent=2)
                     return ReadResourceResult(
                         contents=[TextContent(type="text", text=content)]
                     )
@@ -302,4 +377,7 @@ if __name__ == "__main__":
             sys.exit(0)
     
     # Run the server
-    asyncio.run(main()) 
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main()) 
\ No newline at end of file
@@ -2,67 +2,157 @@
 """
 Quick fix script for critical flake8 issues
 """
+import glob
+import io
 import re
 import os
+import shutil
+import sys
+import tempfile
+import tokenize
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+# Longest line flake8 accepts (E501)
+MAX_LINE_LENGTH = 79
+# The unused prompt assignment left behind in cli.py
+UNUSED_PROMPT_PATTERN = re.compile(
+    r'\s*prompt = ChatPromptTemplate\.from_messages\(\s*\[.*?\]\s*\)\s*\n', re.DOTALL
+)
+# Python 3.12+ tokenizes f-strings into parts; nothing inside one may be split
+FSTRING_START = getattr(tokenize, 'FSTRING_START', None)
+FSTRING_END = getattr(tokenize, 'FSTRING_END', None)
+# One backslash escape in a string literal; \N{...} names span several characters
+ESCAPE_PATTERN = re.compile(r'\\(N\{[^}]*\}|.)', re.DOTALL)
+
+def _string_breaks(token):
+    """Points where a one-line string literal can be split into two adjacent literals"""
+    text = token.string
+    prefix_len = len(text) - len(text.lstrip('rRuUbB'))
+    prefix, quote = text[:prefix_len], text[prefix_len]
+    if quote not in '"\'' or text.startswith(quote * 3, prefix_len):
+        # f-strings (before 3.12) and triple-quoted strings are left alone
+        return []
+    body = text[prefix_len + 1:-1]
+    body_col = token.start[1] + prefix_len + 1
+    # Spaces inside a \N{...} escape belong to the character name
+    protected = set()
+    if 'r' not in prefix.lower():
+        for match in ESCAPE_PATTERN.finditer(body):
+            if match.group(1).startswith('N{'):
+                protected.update(range(*match.span()))
+    return [
+        (body_col + i + 1, quote, prefix + quote)
+        for i, char in enumerate(body[:-1])
+        if char == ' ' and i not in protected
+    ]
+
+def _find_breaks(source, line_numbers):
+    """
+    Find where the given lines can be broken without changing the code.
+    
+    A break is (column, text closing the piece before it, text opening the
+    piece after it). Inside brackets a newline may follow any comma, and a
+    plain string literal may be split after a space into two literals that
+    Python concatenates.
+    """
+    breaks = defaultdict(list)
+    depth = 0
+    fstring_depth = 0
+    for token in tokenize.generate_tokens(io.StringIO(source).readline):
+        if token.type == FSTRING_START:
+            fstring_depth += 1
+        elif token.type == FSTRING_END:
+            fstring_depth -= 1
+        elif fstring_depth:
+            continue
+        elif token.type == tokenize.OP:
+            if token.string in ('(', '[', '{'):
+                depth += 1
+            elif token.string in (')', ']', '}'):
+                depth -= 1
+            elif token.string == ',' and depth and token.end[0] in line_numbers:
+                breaks[token.end[0]].append((token.end[1], '', ''))
+        elif (token.type == tokenize.STRING and depth
+              and token.start[0] == token.end[0] and token.start[0] in line_numbers):
+            breaks[token.start[0]].extend(_string_breaks(token))
+    return breaks
+
+def _wrap_line(line, breaks):
+    """Break a line at the given points, fitting as much as possible on each piece"""
+    content = line.rstrip('\n')
+    eol = line[len(content):]
+    indent = ' ' * (len(content) - len(content.lstrip()) + 4)
+    
+    def render(start, reopen, end, close):
+        piece = content[start:end]
+        if start:
+            piece = indent + reopen + (piece if reopen else piece.lstrip())
+        return (piece if close else piece.rstrip()) + close
+    
+    pieces = []
+    start, reopen = 0, ''
+    pending = None
+    for brk in sorted(breaks):
+        if not content[brk[0]:].strip():
+            # A trailing comma leaves nothing to move to the next line
+            continue
+        if pending is not None and len(render(start, reopen, brk[0], brk[1])) > MAX_LINE_LENGTH:
+            pieces.append(render(start, reopen, pending[0], pending[1]))
+            start, reopen = pending[0], pending[2]
+        pending = brk
+    if (pending is not None and pending[0] > start
+            and len(render(start, reopen, len(content), '')) > MAX_LINE_LENGTH):
+        pieces.append(render(start, reopen, pending[0], pending[1]))
+        start, reopen = pending[0], pending[2]
+    
+    if not pieces:
+        return None
+    pieces.append(render(start, reopen, len(content), ''))
+    return '\n'.join(pieces) + eol
 
 def fix_line_lengths(file_path):
-    """Fix line length issues by breaking long lines"""
+    """Fix line length issues by breaking long lines at token-safe points"""
     with open(file_path, 'r') as f:
         lines = f.readlines()
     
-    modified = False
-    new_lines = []
+    long_lines = {
+        number for number, line in enumerate(lines, 1)
+        if len(line.rstrip()) > MAX_LINE_LENGTH
+    }
+    if not long_lines:
+        return
     
-    for i, line in enumerate(lines):
-        if len(line.rstrip()) > 79:
-            # Try to break long lines at logical points
-            if 'help=' in line and len(line) > 79:
-                # Break help strings
-                match = re.match(r'(\s*.*help=")([^"]+)(".*)', line)
-                if match:
-                    indent, help_text, suffix = match.groups()
-                    if len(help_text) > 50:
-                        # Split help text
-                        words = help_text.split()
-                        line1_words = []
-                        line2_words = []
-                        current_len = len(indent) + 6  # 'help="'
-                        
-                        for word in words:
-                            if current_len + len(word) + 1 < 75:
-                                line1_words.append(word)
-                                current_len += len(word) + 1
-                            else:
-                                line2_words.append(word)
-                        
-                        if line2_words:
-                            new_line1 = f'{indent}"{" ".join(line1_words)} "\n'
-                            new_line2 = f'{" " * (len(indent) + 4)}"{" ".join(line2_words)}"{suffix}'
-                            new_lines.extend([new_line1, new_line2])
-                            modified = True
-                            continue
-            
-            # For other long lines, try simple breaks
-            if ',' in line and len(line) > 79:
-                # Try to break at commas
-                parts = line.split(',')
-                if len(parts) > 1:
-                    indent = len(line) - len(line.lstrip())
-                    new_line = parts[0] + ',\n'
-                    for part in parts[1:-1]:
-                        new_line += ' ' * (indent + 4) + part.strip() + ',\n'
-                    new_line += ' ' * (indent + 4) + parts[-1].strip()
-                    if len(new_line.split('\n')[-1]) < 79:
-                        new_lines.extend(new_line.split('\n'))
-                        modified = True
-                        continue
-        
-        new_lines.append(line)
+    try:
+        breaks = _find_breaks(''.join(lines), long_lines)
+    except (tokenize.TokenError, SyntaxError):
+        # Leave files that don't tokenize alone
+        return
     
-    if modified:
-        with open(file_path, 'w') as f:
-            f.writelines(new_lines)
-        print(f"Fixed line lengths in {file_path}")
+    wrapped = {}
+    for number, line_breaks in breaks.items():
+        new_line = _wrap_line(lines[number - 1], line_breaks)
+        if new_line is not None:
+            wrapped[number] = new_line
+    if not wrapped:
+        return
+    
+    # Write next to the original and swap it in, so an interrupted run
+    # never leaves a half-written file
+    with tempfile.NamedTemporaryFile(
+        'w', delete=False, dir=os.path.dirname(file_path) or '.'
+    ) as fout:
+        try:
+            for number, line in enumerate(lines, 1):
+                fout.write(wrapped.get(number, line))
+        except BaseException:
+            fout.close()
+            os.unlink(fout.name)
+            raise
+    
+    shutil.copymode(file_path, fout.name)
+    os.replace(fout.name, file_path)
+    print(f"Fixed line lengths in {file_path}")
 
 def remove_unused_variables(file_path):
     """Remove unused variable assignments"""
@@ -70,21 +160,32 @@ def remove_unused_variables(file_path):
         content = f.read()
     
     # Remove the specific unused prompt variable
-    pattern = r'\s*prompt = ChatPromptTemplate\.from_messages\(\s*\[.*?\]\s*\)\s*\n'
-    new_content = re.sub(pattern, '', content, flags=re.DOTALL)
+    new_content = UNUSED_PROMPT_PATTERN.sub('', content)
     
     if new_content != content:
         with open(file_path, 'w') as f:
             f.write(new_content)
         print(f"Removed unused variables in {file_path}")
 
+def _fix_one(file_path):
+    """Apply all fixes to a single file"""
+    remove_unused_variables(file_path)
+    fix_line_lengths(file_path)
+
 def main():
     """Main function to fix flake8 issues"""
-    cli_file = 'src/mcp_client_cli/cli.py'
+    # Files or glob patterns (e.g. 'src/**/*.py') from the command line,
+    # defaulting to the CLI module
+    patterns = sys.argv[1:] or ['src/mcp_client_cli/cli.py']
+    files = sorted({path for pattern in patterns for path in glob.glob(pattern, recursive=True)})
     
-    if os.path.exists(cli_file):
-        remove_unused_variables(cli_file)
-        fix_line_lengths(cli_file)
+    if len(files) > 1:
+        # Files are independent and tokenizing and rewriting each one is
+        # CPU-bound, so spread them over processes
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(_fix_one, files, chunksize=8))
+    elif files:
+        _fix_one(files[0])
     
     print("Flake8 fixes completed!")
 
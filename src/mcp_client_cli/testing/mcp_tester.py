@@ -80,6 +80,7 @@ class MCPServerTester:
         """
         self.config = config
         self._active_toolkits: Dict[str, McpToolkit] = {}
+        self._connect_locks: Dict[str, asyncio.Lock] = {}
         self._test_results: Dict[str, TestSuite] = {}
 
     async def test_server_connectivity(
@@ -161,6 +162,102 @@ class MCPServerTester:
                 error_info=traceback.format_exc(),
             )
 
+    async def connect(
+        self, server_config: ServerConfig, server_name: str
+    ) -> McpToolkit:
+        """
+        Open (or reuse) a persistent session to an MCP server.
+
+        Unlike test_server_connectivity, which measures a fresh connection
+        on every call, this pays the process spawn and MCP handshake once so
+        later requests can run on the same session.
+
+        Args:
+            server_config: Server configuration to connect to
+            server_name: Name identifier for the server
+
+        Returns:
+            McpToolkit: Toolkit holding the active session
+        """
+        # Serialize connects per server so concurrent callers share one session
+        lock = self._connect_locks.setdefault(server_name, asyncio.Lock())
+        async with lock:
+            toolkit = self._active_toolkits.get(server_name)
+            if toolkit is None:
+                toolkit = McpToolkit(
+                    name=server_name,
+                    server_param=StdioServerParameters(
+                        command=server_config.command,
+                        args=server_config.args or [],
+                        env=server_config.env or {},
+                    ),
+                    exclude_tools=server_config.exclude_tools or [],
+                )
+                try:
+                    async with asyncio.timeout(10.0):
+                        await toolkit._start_session()
+                except BaseException:
+                    # Don't leave a half-started server process behind
+                    await toolkit.close()
+                    raise
+                self._active_toolkits[server_name] = toolkit
+            return toolkit
+
+    async def test_server_ping(
+        self, server_config: ServerConfig, server_name: str
+    ) -> TestResult:
+        """
+        Test round-trip latency of a ping over a persistent server session.
+
+        Args:
+            server_config: Server configuration to test
+            server_name: Name identifier for the server
+
+        Returns:
+            TestResult: Result of ping test with confidence score
+        """
+        start_time = time.time()
+        test_name = f"{server_name}_ping"
+
+        try:
+            toolkit = await self.connect(server_config, server_name)
+
+            async with asyncio.timeout(10.0):
+                await toolkit._session.send_ping()
+
+            execution_time = time.time() - start_time
+
+            return TestResult(
+                test_name=test_name,
+                status=TestStatus.PASSED,
+                confidence_score=0.95,
+                execution_time=execution_time,
+                message=f"Ping succeeded for {server_name}",
+                details={"ping_time": execution_time},
+            )
+
+        except asyncio.TimeoutError:
+            execution_time = time.time() - start_time
+            return TestResult(
+                test_name=test_name,
+                status=TestStatus.FAILED,
+                confidence_score=0.90,
+                execution_time=execution_time,
+                message=f"Ping timeout for {server_name}",
+                error_info="Ping timed out after 10 seconds",
+            )
+
+        except Exception as e:
+            execution_time = time.time() - start_time
+            return TestResult(
+                test_name=test_name,
+                status=TestStatus.ERROR,
+                confidence_score=0.85,
+                execution_time=execution_time,
+                message=f"Ping error for {server_name}: {str(e)}",
+                error_info=traceback.format_exc(),
+            )
+
     async def test_tool_discovery(
         self, server_config: ServerConfig, server_name: str
     ) -> TestResult:
@@ -0,0 +1,194 @@
+"""
+Tests for the Dagger pipeline test matrix.
+
+This module tests .dagger/src/test_matrix.py, which is loaded from its path
+because the Dagger module directory is not an importable package.
+"""
+
+import importlib.util
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+MATRIX_PATH = Path(__file__).resolve().parents[1] / ".dagger" / "src" / "test_matrix.py"
+
+
+def _load_matrix_module():
+    """Import test_matrix.py under a private name."""
+    spec = importlib.util.spec_from_file_location("dagger_test_matrix", MATRIX_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+matrix = _load_matrix_module()
+
+
+@pytest.mark.parametrize(
+    "scenario, expected_count",
+    [
+        ("basic", 2),
+        ("comprehensive", 5),
+        ("nightly", 10),
+        ("performance", 3),
+        ("compatibility", 3),
+    ]
+)
+def test_scenario_config_counts(scenario, expected_count):
+    """Test that each scenario builds the expected number of configs."""
+    assert len(matrix.get_test_matrix_for_scenario(scenario)) == expected_count
+
+
+def test_comprehensive_factories_match_scenario():
+    """Test that comprehensive() and comprehensive_batched() return the scenario matrix."""
+    scenario_configs = matrix.get_test_matrix_for_scenario("comprehensive")
+    
+    assert matrix.DefaultTestMatrices.comprehensive() == scenario_configs
+    batched = matrix.DefaultTestMatrices.comprehensive_batched()
+    assert [config for configs in batched.values() for config in configs] == scenario_configs
+
+
+def test_unknown_scenario():
+    """Test that an unknown scenario name is rejected."""
+    with pytest.raises(ValueError, match="Unknown scenario"):
+        matrix.get_test_matrix_for_scenario("weekly")
+
+
+def _python_config(test_type, server):
+    """Python 3.12 config running one test type against its own server."""
+    return matrix.TestMatrixConfig(
+        environment=matrix.TestEnvironment.PYTHON_ONLY,
+        python_version="3.12",
+        test_types=(test_type,),
+        server_configs=[server]
+    )
+
+
+def _write_history(path, durations):
+    """Write a duration history keyed by Python 3.12 test type."""
+    path.write_text(json.dumps({f"python:3.12:-:{t.value}": seconds for t, seconds in durations.items()}))
+
+
+def test_timed_batches_fill_budget_first_fit_decreasing(tmp_path):
+    """Test that configs are packed into batches that fit the time budget."""
+    TestType = matrix.TestType
+    history_path = tmp_path / "durations.json"
+    _write_history(history_path, {
+        TestType.FUNCTIONAL: 60,
+        TestType.PERFORMANCE: 50,
+        TestType.SECURITY: 40,
+        TestType.COMPATIBILITY: 30,
+    })
+    builder = matrix.TestMatrixBuilder()
+    for index, test_type in enumerate([TestType.COMPATIBILITY, TestType.SECURITY,
+                                       TestType.PERFORMANCE, TestType.FUNCTIONAL]):
+        builder.with_custom_config(_python_config(test_type, f"server-{index}"))
+    
+    batches = builder.add_timed_batches(100, history_path).build()
+    
+    assert [batch.test_types for batch in batches] == [
+        (TestType.FUNCTIONAL, TestType.SECURITY),
+        (TestType.PERFORMANCE, TestType.COMPATIBILITY),
+    ]
+    assert all(batch.timeout_seconds == 600 for batch in batches)
+
+
+def test_timed_batches_isolate_oversized_configs(tmp_path):
+    """Test that a config over budget gets a batch of its own, placed first."""
+    TestType = matrix.TestType
+    history_path = tmp_path / "durations.json"
+    _write_history(history_path, {
+        TestType.FUNCTIONAL: 250,
+        TestType.PERFORMANCE: 30,
+        TestType.SECURITY: 20,
+    })
+    builder = matrix.TestMatrixBuilder()
+    for index, test_type in enumerate([TestType.SECURITY, TestType.PERFORMANCE, TestType.FUNCTIONAL]):
+        builder.with_custom_config(_python_config(test_type, f"server-{index}"))
+    
+    batches = builder.add_timed_batches(100, history_path).build()
+    
+    assert [batch.test_types for batch in batches] == [
+        (TestType.FUNCTIONAL,),
+        (TestType.PERFORMANCE, TestType.SECURITY),
+    ]
+
+
+def test_record_execution_times_merges_history(tmp_path):
+    """Test that new durations are folded into existing history as an EWMA."""
+    TestType = matrix.TestType
+    history_path = tmp_path / "durations.json"
+    _write_history(history_path, {TestType.FUNCTIONAL: 10.0})
+    batched = matrix.TestMatrixConfig(
+        environment=matrix.TestEnvironment.PYTHON_ONLY,
+        python_version="3.12",
+        test_types=(TestType.PERFORMANCE, TestType.SECURITY)
+    )
+    results = [
+        matrix.TestResult(config=_python_config(TestType.FUNCTIONAL, "server"), success=True,
+                          execution_time=20.0, output=""),
+        matrix.TestResult(config=batched, success=True, execution_time=40.0, output=""),
+    ]
+    
+    history = matrix.record_execution_times(results, history_path)
+    
+    assert history == pytest.approx({
+        "python:3.12:-:functional": 0.3 * 20.0 + 0.7 * 10.0,
+        "python:3.12:-:performance": 20.0,
+        "python:3.12:-:security": 20.0,
+    })
+    assert json.loads(history_path.read_text()) == history
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "payload",
+    [b"", b"not a pickle", pickle.dumps(object)[:-3], b"cnomodule\nThing\n."],
+    ids=["empty", "garbage", "truncated", "missing-module"]
+)
+async def test_result_cache_recovers_from_corrupt_entry(tmp_path, payload):
+    """Test that an unreadable cache entry is discarded and the config re-run."""
+    config = _python_config(matrix.TestType.FUNCTIONAL, "server")
+    cache_path = tmp_path / f"{config.cache_key('abc123')}.pickle"
+    cache_path.write_bytes(payload)
+    fresh = matrix.TestResult(config=config, success=True, execution_time=1.0, output="fresh")
+    runs = []
+    
+    async def run_test(run_config):
+        runs.append(run_config)
+        return fresh
+    
+    result = await matrix.run_with_result_cache(config, "abc123", run_test, cache_dir=tmp_path)
+    
+    assert result == fresh
+    assert runs == [config]
+    with cache_path.open("rb") as cache_file:
+        assert pickle.load(cache_file) == fresh
+
+
+def test_result_cache_dir_is_anchored_to_dagger_module():
+    """Test that the default cache directory does not depend on the working directory."""
+    assert matrix.RESULT_CACHE_DIR == MATRIX_PATH.parents[1] / ".cache"
+
+
+@pytest.mark.parametrize("sha", ["0" * 40, "1b20293", "8e15c19", "55bbb97", "deadbeef"])
+def test_compatibility_matrix_is_consistent_per_revision(monkeypatch, sha):
+    """Test that a revision always gets the same matrix, with one Python version throughout."""
+    monkeypatch.setenv("GITHUB_SHA", sha)
+    # Bypass the per-process memoization so each revision is built fresh
+    build = matrix.DefaultTestMatrices.compatibility_focused.__wrapped__
+    
+    configs = build()
+    
+    assert build() == configs
+    python_versions = {config.python_version for config in configs if config.python_version}
+    assert len(python_versions) == 1
+    assert [config.test_types for config in configs] == [
+        (matrix.TestType.FUNCTIONAL,),
+        (matrix.TestType.FUNCTIONAL,),
+        (matrix.TestType.COMPATIBILITY,),
+    ]
@@ -0,0 +1,89 @@
+"""
+Tests for the fix_flake8 long line splitter.
+
+Every rewrite must leave the code unchanged: the tests compare the AST of
+each sample before and after its long lines are broken.
+"""
+
+import ast
+import io
+import tokenize
+
+import pytest
+
+import fix_flake8
+
+# Sample sources whose long lines the splitter may break
+SAMPLES = {
+    "call arguments": (
+        "result = compute_something(first_argument, second_argument, third_argument, fourth)\n"
+    ),
+    "string argument": (
+        'parser.add_argument("--flag", help="A long help string that goes on and on well past the limit")\n'
+    ),
+    "named escape": (
+        'bar("\\N{LATIN SMALL LETTER A}xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx")\n'
+    ),
+    "named escape with spaces around": (
+        'bar("before the name \\N{LATIN SMALL LETTER A} and after the name, long enough to be split")\n'
+    ),
+    "raw and bytes strings": (
+        'pattern = compile(r"\\d+ \\s+ \\w+ words in a raw string that runs past the limit", b"bytes too")\n'
+    ),
+    "f-string": (
+        'message = log(f"value {compute(first, second, third)} and {other, thing} past the limit ok")\n'
+    ),
+    "nested brackets and comment": (
+        "table = {'key': [one, two, three], 'other': (four, five, six), 'last': seven}  # a, b, c\n"
+    ),
+    "trailing comma": (
+        "values = [\n"
+        "    some_function_name(argument_number_one) if condition_holds else other_value_x,\n"
+        "]\n"
+    ),
+    "triple-quoted string": (
+        'text = dedent("""a triple quoted string with spaces that is longer than the limit allows""")\n'
+    ),
+}
+
+
+def _rewrite(tmp_path, source):
+    """Run the splitter over a file holding ``source`` and return the result."""
+    path = tmp_path / "sample.py"
+    path.write_text(source)
+    fix_flake8.fix_line_lengths(str(path))
+    return path.read_text()
+
+
+@pytest.mark.parametrize("source", SAMPLES.values(), ids=SAMPLES.keys())
+def test_rewrite_preserves_ast(tmp_path, source):
+    """Test that breaking long lines never changes what the code does."""
+    rewritten = _rewrite(tmp_path, source)
+    
+    assert ast.dump(ast.parse(rewritten)) == ast.dump(ast.parse(source))
+    longest = max(len(line) for line in source.splitlines())
+    assert all(len(line) <= longest for line in rewritten.splitlines())
+
+
+def test_rewrite_breaks_call_arguments(tmp_path):
+    """Test that a long call is broken after a comma and indented."""
+    rewritten = _rewrite(tmp_path, SAMPLES["call arguments"])
+    
+    assert rewritten == (
+        "result = compute_something(first_argument, second_argument, third_argument,\n"
+        "    fourth)\n"
+    )
+
+
+def test_string_breaks_skip_named_escapes():
+    """Test that a string is never split inside a \\N{...} escape."""
+    source = 'bar("\\N{LATIN SMALL LETTER A} x")\n'
+    token = next(
+        token for token in tokenize.generate_tokens(io.StringIO(source).readline)
+        if token.type == tokenize.STRING
+    )
+    
+    breaks = fix_flake8._string_breaks(token)
+    
+    # Only the space after the escape is a valid break point
+    assert [column for column, _, _ in breaks] == [source.index(" x") + 1]
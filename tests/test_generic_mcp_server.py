@@ -0,0 +1,192 @@
+"""
+Tests for the generic example MCP server.
+
+This module tests examples/generic_mcp_server.py, plus the calculate
+expression check it shares with examples/python_mcp_server.py. Tests that
+run the server need the mcp 1.x server API (Server.call_tool and friends)
+and are skipped when the installed mcp does not provide it.
+"""
+
+import asyncio
+import inspect
+import json
+
+import pytest
+from mcp import types
+from mcp.server import Server
+
+from examples import generic_mcp_server, python_mcp_server
+
+requires_server_api = pytest.mark.skipif(
+    not hasattr(Server, "call_tool"),
+    reason="installed mcp does not provide the mcp 1.x server API"
+)
+
+
+@pytest.fixture
+def server():
+    """Fresh example server with an empty data store."""
+    return generic_mcp_server.GenericMCPServer()
+
+
+async def _call_tool(server, name, arguments):
+    """Send a tools/call request through the registered MCP handler."""
+    handler = server.server.request_handlers[types.CallToolRequest]
+    response = await handler(
+        types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(name=name, arguments=arguments)
+        )
+    )
+    return response.root
+
+
+@requires_server_api
+@pytest.mark.asyncio
+async def test_call_tool_validates_with_precompiled_validators(server):
+    """Test that arguments are validated whether or not mcp can skip its own check."""
+    # validate_input only exists in mcp releases that validate tool input
+    # themselves; older releases (such as the locked 1.9.1) take no options
+    if "validate_input" in inspect.signature(Server.call_tool).parameters:
+        assert generic_mcp_server._call_tool_options() == {"validate_input": False}
+    else:
+        assert generic_mcp_server._call_tool_options() == {}
+    
+    result = await _call_tool(server, "echo", {})
+    
+    assert result.isError
+    assert result.content[0].text == "Invalid arguments for echo: 'text' is a required property"
+    
+    result = await _call_tool(server, "echo", {"text": "hello"})
+    
+    assert not result.isError
+    assert result.content[0].text == "Echo: hello"
+
+
+@pytest.mark.parametrize("module", [generic_mcp_server, python_mcp_server])
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("2 + 2", 4),
+        ("7 // 2", 3),
+        ("2**3", 8),
+        ("2**-1", 0.5),
+        ("-2**2", -4),
+        ("(2**3) * 4**2", 128),
+        ("10**100", 10**100),
+    ]
+)
+def test_compile_expression_evaluates_arithmetic(module, expression, expected):
+    """Test that arithmetic, including bounded powers, evaluates as Python would."""
+    code = module._compile_expression(expression)
+    
+    assert eval(code, {"__builtins__": {}}, {}) == expected
+
+
+@pytest.mark.parametrize("module", [generic_mcp_server, python_mcp_server])
+@pytest.mark.parametrize(
+    "expression, message",
+    [
+        ("9**9**9", "exponent must be a number"),
+        ("2**101", "exponent must be a number"),
+        ("2**(1 + 1)", "exponent must be a number"),
+        ("(9**99)**99", "base of \\*\\* cannot contain"),
+        ("(1).real", "unsupported syntax: Attribute"),
+    ]
+)
+def test_compile_expression_rejects_unsafe_input(module, expression, message):
+    """Test that unbounded powers and non-arithmetic syntax are rejected."""
+    with pytest.raises(ValueError, match=message):
+        module._compile_expression(expression)
+
+
+def _texts(result):
+    """Text of every content item in a tool result."""
+    return [item.text for item in result.content]
+
+
+@requires_server_api
+@pytest.mark.asyncio
+async def test_batch_execute_runs_every_call(server):
+    """Test that a batch runs all of its calls and labels each result."""
+    result = await server._execute("batch_execute", {
+        "calls": [
+            {"name": "store_data", "arguments": {"key": "a", "value": "1"}},
+            {"name": "echo", "arguments": {"text": "hi"}},
+            {"name": "calculate", "arguments": {"expression": "6 * 7"}},
+        ]
+    })
+    
+    assert not result.isError
+    assert _texts(result) == [
+        "[0] store_data: Stored '1' under key 'a'",
+        "[1] echo: Echo: hi",
+        "[2] calculate: Result: 42",
+    ]
+
+
+@requires_server_api
+@pytest.mark.asyncio
+async def test_batch_execute_rejects_nested_batches(server):
+    """Test that a batch containing batch_execute is refused without running anything."""
+    result = await server._execute("batch_execute", {
+        "calls": [
+            {"name": "store_data", "arguments": {"key": "a", "value": "1"}},
+            {"name": "batch_execute", "arguments": {"calls": []}},
+        ]
+    })
+    
+    assert result.isError
+    assert _texts(result) == ["Error: batch_execute calls cannot be nested"]
+    assert server.data_store == {}
+
+
+@requires_server_api
+@pytest.mark.asyncio
+async def test_batch_execute_stop_on_error_cancels_remaining_calls(server):
+    """Test that stopOnError skips calls still running once one fails."""
+    slow_started = asyncio.Event()
+    
+    async def slow_echo(arguments):
+        slow_started.set()
+        await asyncio.sleep(60)
+    
+    server._tools["echo"] = slow_echo
+    
+    result = await asyncio.wait_for(
+        server._execute("batch_execute", {
+            "calls": [
+                {"name": "echo", "arguments": {"text": "slow"}},
+                {"name": "get_data", "arguments": {}},
+            ],
+            "stopOnError": True
+        }),
+        timeout=5
+    )
+    
+    assert slow_started.is_set()
+    assert result.isError
+    assert _texts(result) == [
+        "[0] echo: Skipped after an earlier error",
+        "[1] get_data: Invalid arguments for get_data: 'key' is a required property",
+    ]
+
+
+@requires_server_api
+@pytest.mark.asyncio
+async def test_mput_then_mget(server):
+    """Test bulk storage and retrieval, with missing keys reported as null."""
+    result = await server._execute("mput", {"items": {"a": "1", "b": "2"}})
+    
+    assert not result.isError
+    assert _texts(result) == ["Stored 2 items"]
+    assert server.data_store == {"a": "1", "b": "2"}
+    
+    result = await server._execute("mget", {"keys": ["b", "missing"]})
+    
+    assert not result.isError
+    assert json.loads(result.content[0].text) == {"b": "2", "missing": None}
+    
+    result = await server._execute("list_keys", {})
+    
+    assert _texts(result) == ["Stored keys: a, b"]
@@ -5,6 +5,7 @@ This module contains comprehensive tests for the MCP testing infrastructure,
 including functional testing capabilities and configuration validation.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -111,6 +112,131 @@ async def test_server_connectivity_mock():
         assert "Successfully connected" in result.message
 
 
+@pytest.mark.asyncio
+async def test_connect_reuses_session():
+    """Test that connect starts one session and reuses it on later calls."""
+    config = AppConfig(
+        llm=LLMConfig(model="gpt-4o", provider="openai"),
+        system_prompt="Test",
+        mcp_servers={"test": ServerConfig(command="python", args=[])},
+        tools_requires_confirmation=[],
+        testing=TestConfig(),
+    )
+
+    tester = MCPServerTester(config)
+    server_config = config.mcp_servers["test"]
+
+    with patch(
+        "mcp_client_cli.testing.mcp_tester.McpToolkit"
+    ) as mock_toolkit_class:
+        mock_toolkit = AsyncMock()
+        mock_toolkit._start_session = AsyncMock()
+        mock_toolkit_class.return_value = mock_toolkit
+
+        first = await tester.connect(server_config, "test")
+        second = await tester.connect(server_config, "test")
+
+        assert first is second
+        mock_toolkit_class.assert_called_once()
+        mock_toolkit._start_session.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_connect_concurrent_calls_share_session():
+    """Test that concurrent connects to one server start a single session."""
+    config = AppConfig(
+        llm=LLMConfig(model="gpt-4o", provider="openai"),
+        system_prompt="Test",
+        mcp_servers={"test": ServerConfig(command="python", args=[])},
+        tools_requires_confirmation=[],
+        testing=TestConfig(),
+    )
+
+    tester = MCPServerTester(config)
+    server_config = config.mcp_servers["test"]
+
+    with patch(
+        "mcp_client_cli.testing.mcp_tester.McpToolkit"
+    ) as mock_toolkit_class:
+        mock_toolkit = AsyncMock()
+
+        async def slow_start():
+            await asyncio.sleep(0.01)
+
+        mock_toolkit._start_session = AsyncMock(side_effect=slow_start)
+        mock_toolkit_class.return_value = mock_toolkit
+
+        toolkits = await asyncio.gather(
+            *(tester.connect(server_config, "test") for _ in range(5))
+        )
+
+        assert all(toolkit is mock_toolkit for toolkit in toolkits)
+        mock_toolkit_class.assert_called_once()
+        mock_toolkit._start_session.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_connect_closes_toolkit_on_failure():
+    """Test that a session which fails to start is closed and not kept."""
+    config = AppConfig(
+        llm=LLMConfig(model="gpt-4o", provider="openai"),
+        system_prompt="Test",
+        mcp_servers={"test": ServerConfig(command="python", args=[])},
+        tools_requires_confirmation=[],
+        testing=TestConfig(),
+    )
+
+    tester = MCPServerTester(config)
+    server_config = config.mcp_servers["test"]
+
+    with patch(
+        "mcp_client_cli.testing.mcp_tester.McpToolkit"
+    ) as mock_toolkit_class:
+        mock_toolkit = AsyncMock()
+        mock_toolkit._start_session = AsyncMock(
+            side_effect=RuntimeError("spawn failed")
+        )
+        mock_toolkit_class.return_value = mock_toolkit
+
+        with pytest.raises(RuntimeError, match="spawn failed"):
+            await tester.connect(server_config, "test")
+
+        mock_toolkit.close.assert_awaited_once()
+        assert "test" not in tester._active_toolkits
+
+
+@pytest.mark.asyncio
+async def test_server_ping_mock():
+    """Test ping over a persistent session with mocked toolkit."""
+    config = AppConfig(
+        llm=LLMConfig(model="gpt-4o", provider="openai"),
+        system_prompt="Test",
+        mcp_servers={"test": ServerConfig(command="python", args=[])},
+        tools_requires_confirmation=[],
+        testing=TestConfig(),
+    )
+
+    tester = MCPServerTester(config)
+    server_config = config.mcp_servers["test"]
+
+    with patch(
+        "mcp_client_cli.testing.mcp_tester.McpToolkit"
+    ) as mock_toolkit_class:
+        mock_toolkit = AsyncMock()
+        mock_toolkit._start_session = AsyncMock()
+        mock_toolkit._session.send_ping = AsyncMock()
+        mock_toolkit_class.return_value = mock_toolkit
+
+        results = [
+            await tester.test_server_ping(server_config, "test")
+            for _ in range(3)
+        ]
+
+        assert all(r.status == TestStatus.PASSED for r in results)
+        assert mock_toolkit._session.send_ping.await_count == 3
+        mock_toolkit._start_session.assert_awaited_once()
+
+
 def test_test_result_creation():
     """Test TestResult dataclass creation."""
     result = TestResult(